@@ -4,12 +4,22 @@ For each SNP in the panel, extracts the genotype from the parsed data dict.
 Handles strand flipping for ambiguous A/T and C/G SNPs using frequency context.
 """
 
+from collections import Counter
+
 COMPLEMENT = {"A": "T", "T": "A", "C": "G", "G": "C"}
 
 # SNPs where both alleles are complementary (ambiguous strand)
 AMBIGUOUS_PAIRS = {frozenset(["A", "T"]), frozenset(["C", "G"])}
 
 
+class SnpCalls(dict):
+    """rsid → call dict, with per-status tallies kept in ``counts``."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.counts = Counter()
+
+
 def flip_genotype(genotype: str) -> str:
     """Return the complement strand genotype."""
     return "".join(COMPLEMENT.get(b, b) for b in genotype)
@@ -19,7 +29,7 @@ def is_ambiguous(ref: str, alt: str) -> bool:
     return frozenset([ref, alt]) in AMBIGUOUS_PAIRS
 
 
-def extract_snp_genotypes(genotype_table: dict, snp_panel: list) -> dict:
+def extract_snp_genotypes(genotype_table: dict, snp_panel: list) -> SnpCalls:
     """
     For each SNP in the panel, look up the genotype in genotype_table.
 
@@ -32,8 +42,11 @@ def extract_snp_genotypes(genotype_table: dict, snp_panel: list) -> dict:
       "risk_allele": "T",
       "risk_count": 1             # 0, 1, or 2 copies of risk allele
     }
+
+    ``results.counts`` maps each status to the number of SNPs with it.
     """
-    results = {}
+    results = SnpCalls()
+    counts = results.counts
 
     for snp in snp_panel:
         rsid = snp["rsid"]
@@ -51,6 +64,7 @@ def extract_snp_genotypes(genotype_table: dict, snp_panel: list) -> dict:
                 "risk_count": None,
                 "nutrient_domain": snp["nutrient_domain"],
             }
+            counts["not_tested"] += 1
             continue
 
         raw_geno = genotype_table[rsid]
@@ -65,6 +79,7 @@ def extract_snp_genotypes(genotype_table: dict, snp_panel: list) -> dict:
                 "risk_count": None,
                 "nutrient_domain": snp["nutrient_domain"],
             }
+            counts["no_call"] += 1
             continue
 
         # Try direct match first
@@ -89,6 +104,7 @@ def extract_snp_genotypes(genotype_table: dict, snp_panel: list) -> dict:
                 "risk_count": risk_count,
                 "nutrient_domain": snp["nutrient_domain"],
             }
+            counts["found"] += 1
         else:
             # Neither raw nor flipped genotype contains the risk allele
             print(
@@ -110,5 +126,6 @@ def extract_snp_genotypes(genotype_table: dict, snp_panel: list) -> dict:
                     f"'{risk_allele}' on either strand"
                 ),
             }
+            counts["allele_mismatch"] += 1
 
     return results
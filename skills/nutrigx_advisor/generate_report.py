@@ -3,7 +3,10 @@ generate_report.py — Markdown report + matplotlib figures for NutriGx Advisor
 """
 
 import os
+import sys
 import json
+import importlib.util
+import multiprocessing
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -93,6 +96,16 @@ def generate_report(snp_calls, risk_scores, snp_panel, output_dir, figures=True,
     output_dir = Path(output_dir)
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
+    # Figures are independent of the Markdown, so with both of them to draw
+    # they render in a child process while the report is assembled. A spawn
+    # costs ~0.7 s of interpreter start-up, so a single figure is drawn
+    # inline afterwards instead. "spawn" avoids fork+matplotlib deadlocks.
+    figure_proc = None
+    if figures and len(_figure_jobs(risk_scores)) > 1:
+        ctx = multiprocessing.get_context("spawn")
+        figure_proc = ctx.Process(target=_generate_figures, args=(risk_scores, output_dir))
+        figure_proc.start()
+
     lines = []
 
     # ── Header ────────────────────────────────────────────────────────────────
@@ -179,11 +192,10 @@ def generate_report(snp_calls, risk_scores, snp_panel, output_dir, figures=True,
                 "|------|------|----------|:------------:|--------|",
             ]
             for s in data["contributing_snps"]:
-                effect = s["effect_direction"].replace("_", " ").title()
-                lines.append(
-                    f"| {s['gene']} | {s['rsid']} | `{s['genotype']}` "
-                    f"| {s['risk_count']}/2 | {effect} |"
-                )
+                effect = s.effect_direction.replace("_", " ").title()
+                lines.append("| " + " | ".join((
+                    s.gene, s.rsid, f"`{s.genotype}`", f"{s.risk_count}/2", effect,
+                )) + " |")
             lines.append("")
 
         lines += [
@@ -230,31 +242,58 @@ def generate_report(snp_calls, risk_scores, snp_panel, output_dir, figures=True,
     report_path = output_dir / "nutrigx_report.md"
     report_path.write_text(report_text)
 
-    if figures:
+    if figure_proc is not None:
+        figure_proc.join()
+        if figure_proc.exitcode != 0:
+            print(f"[NutriGx] WARNING: figure rendering failed (exit code "
+                  f"{figure_proc.exitcode}); figures may be missing from {output_dir}",
+                  file=sys.stderr)
+    elif figures:
         _generate_figures(risk_scores, output_dir)
 
     return str(report_path)
 
 
+def _figure_jobs(risk_scores: dict) -> list:
+    """The figure drawers _generate_figures will run, in order: the radar
+    chart needs at least three scored domains, and the heatmap also needs
+    seaborn/pandas and some contributing SNPs."""
+    if sum(v["score"] is not None for v in risk_scores.values()) < 3:
+        return []
+    jobs = [_draw_radar]
+    if (
+        importlib.util.find_spec("seaborn") is not None
+        and importlib.util.find_spec("pandas") is not None
+        and any(v.get("contributing_snps") for v in risk_scores.values())
+    ):
+        jobs.append(_draw_heatmap)
+    return jobs
+
+
 def _generate_figures(risk_scores: dict, output_dir: Path):
     """Generate radar chart and heatmap."""
     try:
-        import numpy as np
         import matplotlib
         matplotlib.use("Agg")
-        import matplotlib.pyplot as plt
+        import matplotlib.pyplot  # pulls in numpy as well
     except ImportError:
         print("[NutriGx] matplotlib/numpy not available — skipping figures")
         return
 
+    for draw in _figure_jobs(risk_scores):
+        draw(risk_scores, output_dir)
+
+
+def _draw_radar(risk_scores: dict, output_dir: Path):
+    """Radar chart of the scored domains → nutrigx_radar.png."""
+    import numpy as np
+    import matplotlib.pyplot as plt
+
     # ── Radar Chart ───────────────────────────────────────────────────────────
     scored = {d: v for d, v in risk_scores.items() if v["score"] is not None}
     labels = [DOMAIN_LABELS.get(d, d) for d in scored]
     values = [v["score"] for v in scored.values()]
 
-    if len(labels) < 3:
-        return
-
     N = len(labels)
     angles = [n / float(N) * 2 * np.pi for n in range(N)]
     angles += angles[:1]
@@ -279,6 +318,11 @@ def _generate_figures(risk_scores: dict, output_dir: Path):
     fig.savefig(output_dir / "nutrigx_radar.png", dpi=150, bbox_inches="tight")
     plt.close()
 
+
+def _draw_heatmap(risk_scores: dict, output_dir: Path):
+    """Gene × nutrient heatmap of SNP raw scores → nutrigx_heatmap.png."""
+    import matplotlib.pyplot as plt
+
     # ── Heatmap ───────────────────────────────────────────────────────────────
     try:
         import seaborn as sns
@@ -288,9 +332,9 @@ def _generate_figures(risk_scores: dict, output_dir: Path):
         for domain, data in risk_scores.items():
             for snp in data["contributing_snps"]:
                 rows.append({
-                    "Gene": snp["gene"],
+                    "Gene": snp.gene,
                     "Nutrient": DOMAIN_LABELS.get(domain, domain),
-                    "Score": snp["raw_score"],
+                    "Score": snp.raw_score,
                 })
 
         if rows:
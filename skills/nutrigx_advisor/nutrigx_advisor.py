@@ -67,14 +67,15 @@ def main():
         sys.exit(1)
 
     print(f"[NutriGx] Parsing input: {input_path}")
-    genotype_table = parse_genetic_file(str(input_path), fmt=args.format)
-    print(f"[NutriGx] Loaded {len(genotype_table):,} variants")
+    panel_rsids = {s["rsid"] for s in snp_panel}
+    genotype_table = parse_genetic_file(str(input_path), fmt=args.format, keep=panel_rsids)
+    print(f"[NutriGx] Loaded {len(genotype_table):,} panel variants")
 
     print("[NutriGx] Extracting SNP genotypes from panel ...")
     snp_calls = extract_snp_genotypes(genotype_table, snp_panel)
 
-    present = sum(1 for v in snp_calls.values() if v["status"] == "found")
-    mismatched = sum(1 for v in snp_calls.values() if v["status"] == "allele_mismatch")
+    present = snp_calls.counts["found"]
+    mismatched = snp_calls.counts["allele_mismatch"]
     print(f"[NutriGx] Panel coverage: {present}/{len(snp_panel)} SNPs found")
     if mismatched > 0:
         print(f"[NutriGx] Allele mismatches: {mismatched} SNP(s) had unrecognised alleles")
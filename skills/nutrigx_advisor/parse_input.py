@@ -32,25 +32,34 @@ def detect_format(filepath: str) -> str:
     )
 
 
-def parse_23andme(filepath: str) -> dict:
-    """Parse 23andMe raw data file. Returns {rsid: genotype}."""
+def parse_23andme(filepath: str, keep: set | None = None) -> dict:
+    """Parse 23andMe raw data file. Returns {rsid: genotype}.
+
+    If ``keep`` is given, only rsids in that set are returned.
+    """
     genotypes = {}
-    with open(filepath, encoding="utf-8", errors="replace") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            parts = line.split("\t")
-            if len(parts) < 4:
-                continue
-            rsid, chrom, pos, genotype = parts[0], parts[1], parts[2], parts[3]
-            if rsid.startswith("rs"):
-                genotypes[rsid] = genotype.replace("-", "")
+    with open(filepath, "rb") as f:
+        data = f.read()
+    # A single startswith(b"rs") test rules out comments, blanks and non-rs ids
+    for line in data.split(b"\n"):
+        if not line.startswith(b"rs"):
+            continue
+        parts = line.split(b"\t", 4)
+        if len(parts) < 4:
+            continue
+        rsid = parts[0].decode("utf-8", "replace")
+        if keep is not None and rsid not in keep:
+            continue
+        genotype = parts[3].strip().replace(b"-", b"")
+        genotypes[rsid] = genotype.decode("utf-8", "replace")
     return genotypes
 
 
-def parse_ancestry(filepath: str) -> dict:
-    """Parse AncestryDNA raw data file. Returns {rsid: genotype}."""
+def parse_ancestry(filepath: str, keep: set | None = None) -> dict:
+    """Parse AncestryDNA raw data file. Returns {rsid: genotype}.
+
+    If ``keep`` is given, only rsids in that set are returned.
+    """
     genotypes = {}
     with open(filepath, encoding="utf-8", errors="replace") as f:
         reader = csv.DictReader(f, delimiter="\t")
@@ -67,6 +76,8 @@ def parse_ancestry(filepath: str) -> dict:
     reader = csv.DictReader(lines, delimiter="\t")
     for row in reader:
         rsid = row.get("rsid", "").strip()
+        if keep is not None and rsid not in keep:
+            continue
         allele1 = row.get("allele1", "").strip()
         allele2 = row.get("allele2", "").strip()
         if rsid.startswith("rs"):
@@ -74,8 +85,12 @@ def parse_ancestry(filepath: str) -> dict:
     return genotypes
 
 
-def parse_vcf(filepath: str) -> dict:
-    """Parse VCF file, extracting GT field. Returns {rsid: genotype_bases}."""
+def parse_vcf(filepath: str, keep: set | None = None) -> dict:
+    """Parse VCF file, extracting GT field. Returns {rsid: genotype_bases}.
+
+    If ``keep`` is given, rows whose rsid is not in that set are skipped
+    before any genotype decoding.
+    """
     genotypes = {}
     chrom_col, pos_col, id_col, ref_col, alt_col, gt_col = 0, 1, 2, 3, 4, 9
 
@@ -92,6 +107,8 @@ def parse_vcf(filepath: str) -> dict:
             rsid = parts[id_col]
             if not rsid.startswith("rs"):
                 continue
+            if keep is not None and rsid not in keep:
+                continue
             ref = parts[ref_col]
             alts = parts[alt_col].split(",")
             alleles = [ref] + alts
@@ -118,8 +135,12 @@ def parse_vcf(filepath: str) -> dict:
     return genotypes
 
 
-def parse_genetic_file(filepath: str, fmt: str = "auto") -> dict:
-    """Parse genetic data file in any supported format."""
+def parse_genetic_file(filepath: str, fmt: str = "auto", keep: set | None = None) -> dict:
+    """Parse genetic data file in any supported format.
+
+    Pass ``keep`` (e.g. the panel rsids) to drop all other variants at
+    parse time instead of materialising the whole genome.
+    """
     if fmt == "auto":
         fmt = detect_format(filepath)
     
@@ -132,4 +153,4 @@ def parse_genetic_file(filepath: str, fmt: str = "auto") -> dict:
     if fmt not in parsers:
         raise ValueError(f"Unknown format: {fmt}. Choose from: {list(parsers.keys())}")
     
-    return parsers[fmt](filepath)
+    return parsers[fmt](filepath, keep=keep)
@@ -41,7 +41,7 @@ def create_reproducibility_bundle(input_file: str, output_dir: str, panel_path:
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
     # commands.sh
-    cmd_args = " ".join(f"--{k.replace('_', '-')} {v}" for k, v in args.items() if v and k != "synthetic")
+    cmd_args = " ".join([f"--{k.replace('_', '-')} {v}" for k, v in args.items() if v and k != "synthetic"])
     commands = f"""#!/usr/bin/env bash
 # NutriGx Advisor — Reproducibility Script
 # Generated: {timestamp}
@@ -3,7 +3,47 @@ score_variants.py — Compute per-nutrient risk scores from SNP calls
 Each SNP contributes a weighted score; composite scores are 0–10.
 """
 
-from collections import defaultdict
+from __future__ import annotations
+
+import importlib.util
+import sys
+from array import array
+from collections import namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
+
+# NumPy and numba are imported inside the array/batch functions only:
+# scoring one patient is a plain loop, and loading them (numba's JIT cache
+# especially) costs far more than the scoring itself.
+HAS_NUMBA = importlib.util.find_spec("numba") is not None
+
+
+# Not frozen: a frozen dataclass assigns fields through object.__setattr__,
+# which nearly triples construction cost on the per-patient hot path.
+@dataclass(slots=True)
+class SnpRecord:
+    """A single genotyped SNP contributing to a nutrient domain score."""
+    rsid: str
+    gene: str
+    genotype: str
+    risk_count: int
+    raw_score: float
+    weight: float
+    effect_direction: str
+
+
+@dataclass(slots=True, frozen=True)
+class PanelEntry:
+    """Panel metadata for one SNP, with its strings interned."""
+    rsid: str
+    gene: str
+    weight: float
+    effect_direction: str
+    nutrient_domain: str
+
+
+# Dosage score indexed by risk allele count
+_DOSAGE = (0.0, 0.5, 1.0)
 
 
 def snp_raw_score(risk_count: int) -> float:
@@ -15,96 +55,385 @@ def snp_raw_score(risk_count: int) -> float:
     """
     if risk_count is None:
         return None
-    dosage_map = {0: 0.0, 1: 0.5, 2: 1.0}
-    if risk_count not in dosage_map:
+    if risk_count not in (0, 1, 2):
         raise ValueError(
             f"Unexpected risk_count={risk_count!r}. "
             f"Expected 0, 1, 2, or None."
         )
-    return dosage_map[risk_count]
+    return _DOSAGE[risk_count]
+
+
+# Structure-of-arrays view of the SNP panel. SNPs are grouped contiguously
+# by domain (panel order kept within each domain); domain d occupies
+# positions domain_starts[d] up to domain_starts[d + 1].
+PanelArrays = namedtuple(
+    "PanelArrays",
+    ["rsids", "weights", "domain_ids", "domain_starts", "domain_sizes", "domain_names", "entries"],
+)
+
+
+def build_panel_arrays(snp_panel: list) -> PanelArrays:
+    """Convert the panel list into per-SNP NumPy arrays sorted by domain."""
+    import numpy as np
+
+    domain_names = []
+    domain_lookup = {}
+    domain_ids = []
+    rsids = []
+    weights = []
+    entries = []
+    # Single pass over the panel collects every column
+    for snp in snp_panel:
+        domain = snp["nutrient_domain"]
+        domain_id = domain_lookup.get(domain)
+        if domain_id is None:
+            domain_id = domain_lookup[domain] = len(domain_names)
+            domain_names.append(domain)
+        entry = PanelEntry(
+            rsid=sys.intern(snp["rsid"]),
+            gene=sys.intern(snp["gene"]),
+            weight=snp.get("weight", 0.5),
+            effect_direction=sys.intern(snp.get("effect_direction", "")),
+            nutrient_domain=sys.intern(domain),
+        )
+        domain_ids.append(domain_id)
+        rsids.append(entry.rsid)
+        weights.append(entry.weight)
+        entries.append(entry)
+
+    domain_ids = np.array(domain_ids, dtype=np.int32)
+    order = np.argsort(domain_ids, kind="stable")
+    domain_ids = domain_ids[order]
+    domain_sizes = np.bincount(domain_ids, minlength=len(domain_names))
+
+    return PanelArrays(
+        rsids=np.array(rsids, dtype=object)[order],
+        weights=np.array(weights, dtype=np.float64)[order],
+        domain_ids=domain_ids,
+        domain_starts=np.searchsorted(domain_ids, np.arange(len(domain_names))),
+        domain_sizes=tuple(int(n) for n in domain_sizes),
+        domain_names=domain_names,
+        entries=tuple(entries[i] for i in order),
+    )
+
+
+def _accumulate_loop(domain_starts, weights, risk_counts, num, den, tested, missing):
+    """Per-domain weighted sums for one patient; risk_counts uses -1 for missing."""
+    n_domains = domain_starts.shape[0]
+    for d in range(n_domains):
+        end = domain_starts[d + 1] if d + 1 < n_domains else risk_counts.shape[0]
+        for i in range(domain_starts[d], end):
+            rc = risk_counts[i]
+            if rc < 0:
+                missing[d] += 1
+            else:
+                num[d] += rc * 0.5 * weights[i]
+                den[d] += weights[i]
+                tested[d] += 1
+
+
+def _accumulate_numpy(domain_ids, domain_starts, weights, risk_counts, num, den, tested, missing):
+    """NumPy equivalent of _accumulate_loop, used when numba is unavailable."""
+    import numpy as np
+
+    if domain_starts.shape[0] == 0:
+        return
+    n_domains = num.shape[0]
+    found = risk_counts >= 0
+    # Float sums use bincount, which adds strictly in panel order like the
+    # loop kernel; reduceat may reassociate and flip the 2-dp rounding.
+    num += np.bincount(domain_ids, weights=np.where(found, risk_counts * 0.5 * weights, 0.0), minlength=n_domains)
+    den += np.bincount(domain_ids, weights=np.where(found, weights, 0.0), minlength=n_domains)
+    tested += np.add.reduceat(found.astype(np.int64), domain_starts)
+    missing += np.add.reduceat((~found).astype(np.int64), domain_starts)
+
+
+def _accumulate_batch_numpy(domain_ids, domain_starts, weights, risk_counts, num, den, tested, missing):
+    for p in range(risk_counts.shape[0]):
+        _accumulate_numpy(domain_ids, domain_starts, weights, risk_counts[p], num[p], den[p], tested[p], missing[p])
+
+
+@lru_cache(maxsize=None)
+def _numba_batch_kernel():
+    """JIT-compile the per-patient loop for cohorts, or None without numba."""
+    if not HAS_NUMBA:
+        return None
+    from numba import njit, prange
+
+    accumulate = njit(cache=True)(_accumulate_loop)
+
+    @njit(parallel=True, cache=True)
+    def accumulate_batch(domain_starts, weights, risk_counts, num, den, tested, missing):
+        for p in prange(risk_counts.shape[0]):
+            accumulate(domain_starts, weights, risk_counts[p], num[p], den[p], tested[p], missing[p])
+
+    return accumulate_batch
+
+
+def _score_x100(ratio):
+    """Weighted risk ratio (0–1) → score × 100, rounded half to even.
+
+    Every scoring path (single patient, compiled scorer, batch, cohort)
+    rounds through here so they agree on ties. Floats give an int; NumPy
+    arrays and pandas Series are rounded elementwise (NaN stays NaN).
+    """
+    if isinstance(ratio, float):
+        return round(ratio * 1000)
+    import numpy as np
+
+    return np.rint(ratio * 1000)
+
+
+def to_dosage_array(snp_calls: dict, arrays: PanelArrays):
+    """
+    Pack SNP calls into an int8 risk allele count vector aligned with
+    ``arrays.rsids``. Only "found" calls are kept; everything else is -1.
+    """
+    import numpy as np
+
+    # Fill a plain signed-char buffer (cheap per-item stores), then view it
+    # as an ndarray without copying.
+    risk_counts = array("b", [-1]) * len(arrays.rsids)
+    for i, rsid in enumerate(arrays.rsids):
+        call = snp_calls.get(rsid)
+        if call is None or call["status"] != "found":
+            continue
+        rc = call["risk_count"]
+        if snp_raw_score(rc) is None:
+            continue
+        risk_counts[i] = rc
+    return np.frombuffer(risk_counts, dtype=np.int8)
+
+
+def compute_batch_scores(risk_counts, arrays: PanelArrays):
+    """
+    Score many patients at once.
+
+    ``risk_counts`` is a (patients × SNPs) int8 matrix aligned with
+    ``arrays.rsids``, using -1 for SNPs that were not tested. Returns a
+    (patients × domains) float array of 0–10 scores, NaN where a domain
+    has no tested SNPs. Columns follow ``arrays.domain_names``.
+    """
+    import numpy as np
+
+    risk_counts = np.ascontiguousarray(risk_counts, dtype=np.int8)
+    n_patients = risk_counts.shape[0]
+    n_domains = len(arrays.domain_names)
+    num = np.zeros((n_patients, n_domains), dtype=np.float64)
+    den = np.zeros((n_patients, n_domains), dtype=np.float64)
+    tested = np.zeros((n_patients, n_domains), dtype=np.int64)
+    missing = np.zeros((n_patients, n_domains), dtype=np.int64)
+    kernel = _numba_batch_kernel()
+    if kernel is not None:
+        kernel(arrays.domain_starts, arrays.weights, risk_counts, num, den, tested, missing)
+    else:
+        _accumulate_batch_numpy(arrays.domain_ids, arrays.domain_starts, arrays.weights,
+                                risk_counts, num, den, tested, missing)
+    scores = np.full((n_patients, n_domains), np.nan)
+    np.divide(num, den, out=scores, where=den > 0)
+    return _score_x100(scores) / 100
+
+
+def score_cohort(calls_df, panel_df):
+    """
+    Score a cohort from long-form genotype calls with a pandas groupby.
+
+    ``calls_df`` has columns patient_id, rsid and risk_count (0/1/2); SNPs
+    that were not called are either absent or have a NaN risk_count.
+    ``panel_df`` is the panel as a DataFrame (e.g. ``pd.DataFrame(panel)``).
+
+    Returns a (patients × domains) DataFrame of 0–10 scores, NaN where a
+    domain has no tested SNPs. Columns follow panel domain order.
+    """
+    panel_df = panel_df.assign(weight=panel_df.get("weight", 0.5)).fillna({"weight": 0.5})
+    domains = list(dict.fromkeys(panel_df["nutrient_domain"]))
+
+    df = calls_df.dropna(subset=["risk_count"]).merge(
+        panel_df[["rsid", "nutrient_domain", "weight"]], on="rsid", how="inner"
+    )
+    df["raw_w"] = df["risk_count"] * 0.5 * df["weight"]
+    grouped = df.groupby(["patient_id", "nutrient_domain"], sort=False, observed=True).agg(
+        num=("raw_w", "sum"), den=("weight", "sum")
+    )
+    scores = (_score_x100(grouped["num"] / grouped["den"]) / 100).unstack("nutrient_domain")
+    return scores.reindex(
+        index=calls_df["patient_id"].unique(), columns=domains
+    ).rename_axis(index="patient_id", columns=None)
+
+
+def _domain_groups(snp_panel):
+    """Yield (domain, [(rsid, gene, weight, effect_direction), ...]) in panel order."""
+    if isinstance(snp_panel, PanelArrays):
+        start = 0
+        for domain, size in zip(snp_panel.domain_names, snp_panel.domain_sizes):
+            yield domain, [
+                (e.rsid, e.gene, e.weight, e.effect_direction)
+                for e in snp_panel.entries[start:start + size]
+            ]
+            start += size
+        return
+    groups = {}
+    for snp in snp_panel:
+        groups.setdefault(snp["nutrient_domain"], []).append(
+            (snp["rsid"], snp["gene"], snp.get("weight", 0.5), snp.get("effect_direction", ""))
+        )
+    yield from groups.items()
 
 
-def compute_nutrient_risk_scores(snp_calls: dict, snp_panel: list) -> dict:
+def compute_nutrient_risk_scores(
+    snp_calls: dict, snp_panel: list | PanelArrays, *, detail: bool = True
+) -> dict:
     """
+    ``snp_panel`` may be the raw panel list or a PanelArrays from
+    build_panel_arrays(). With ``detail=False`` the per-SNP
+    'contributing_snps' list is not built or returned.
+
+    A single patient is scored with a plain loop over the panel (about 50
+    SNPs), which beats packing arrays for it; use compute_batch_scores for
+    cohorts.
+
     Returns a dict of nutrient_domain → {
         'score': float (0–10),
         'category': str ('Low' | 'Moderate' | 'Elevated'),
-        'contributing_snps': list,
+        'contributing_snps': list[SnpRecord],
         'tested_snps': int,
         'missing_snps': int,
     }
     """
-    # Index panel by rsid
-    panel_index = {s["rsid"]: s for s in snp_panel}
-
-    # Group by nutrient domain
-    domain_snps = defaultdict(list)
-    for snp in snp_panel:
-        domain_snps[snp["nutrient_domain"]].append(snp["rsid"])
-
     results = {}
+    if not snp_calls:
+        # Nothing to look up: every domain is Unknown with all SNPs missing
+        for domain, snps in _domain_groups(snp_panel):
+            size = len(snps)
+            results[domain] = {
+                "score": None,
+                "category": "Unknown",
+                "tested_snps": 0,
+                "missing_snps": size,
+                "coverage": f"0/{size} SNPs tested",
+            }
+            if detail:
+                results[domain]["contributing_snps"] = []
+        return results
 
-    for domain, rsids in domain_snps.items():
+    for domain, snps in _domain_groups(snp_panel):
         weighted_sum = 0.0
         max_possible = 0.0
-        contributing = []
         tested = 0
-        missing = 0
+        contributing = []
 
-        for rsid in rsids:
+        for rsid, gene, weight, effect_direction in snps:
             call = snp_calls.get(rsid)
-            panel_entry = panel_index[rsid]
-            weight = panel_entry.get("weight", 0.5)
-
-            if call is None or call["status"] not in ("found",):
-                missing += 1
+            if call is None or call["status"] != "found":
                 continue
-
-            raw = snp_raw_score(call["risk_count"])
+            rc = call["risk_count"]
+            raw = snp_raw_score(rc)
             if raw is None:
-                missing += 1
                 continue
-
             tested += 1
             weighted_sum += raw * weight
             max_possible += weight
-            contributing.append({
-                "rsid": rsid,
-                "gene": panel_entry["gene"],
-                "genotype": call["normalised"],
-                "risk_count": call["risk_count"],
-                "raw_score": raw,
-                "weight": weight,
-                "effect_direction": panel_entry.get("effect_direction", ""),
-            })
-
-        # Normalise to 0–10; handle all-missing
+            if detail:
+                contributing.append(SnpRecord(
+                    rsid=rsid,
+                    gene=gene,
+                    genotype=call["normalised"],
+                    risk_count=rc,
+                    raw_score=raw,
+                    weight=weight,
+                    effect_direction=effect_direction,
+                ))
+        missing = len(snps) - tested
+
+        # Normalise to 0–1000 (score × 100); -1 marks a domain with no data
         if max_possible > 0:
-            score = round((weighted_sum / max_possible) * 10, 2)
+            x100 = _score_x100(weighted_sum / max_possible)
         elif tested == 0 and missing > 0:
-            score = None  # no data for this domain
+            x100 = -1
         else:
-            score = 0.0
+            x100 = 0
 
-        if score is None:
+        if x100 < 0:
             category = "Unknown"
-        elif score < 3.5:
+        elif x100 < 350:
             category = "Low"
-        elif score < 6.5:
+        elif x100 < 650:
             category = "Moderate"
         else:
             category = "Elevated"
 
-        total_in_domain = tested + missing
-        coverage_str = f"{tested}/{total_in_domain} SNPs tested"
-
         results[domain] = {
-            "score": score,
+            "score": x100 / 100 if x100 >= 0 else None,
             "category": category,
-            "contributing_snps": contributing,
             "tested_snps": tested,
             "missing_snps": missing,
-            "coverage": coverage_str,
+            "coverage": f"{tested}/{len(snps)} SNPs tested",
         }
+        if detail:
+            results[domain]["contributing_snps"] = contributing
 
     return results
+
+
+def compile_scorer(snp_panel: list):
+    """
+    Generate a scoring function specialised for ``snp_panel``.
+
+    The returned callable takes ``snp_calls`` and returns the same result as
+    ``compute_nutrient_risk_scores(snp_calls, snp_panel, detail=False)``,
+    but with every panel SNP unrolled into straight-line code. Compiled
+    scorers are cached per distinct (rsid, domain, weight) panel layout.
+    """
+    key = tuple(
+        (s["rsid"], s["nutrient_domain"], float(s.get("weight", 0.5))) for s in snp_panel
+    )
+    return _compile_scorer(key)
+
+
+@lru_cache(maxsize=8)
+def _compile_scorer(panel_key: tuple):
+    domains = {}
+    for rsid, domain, weight in panel_key:
+        domains.setdefault(domain, []).append((rsid, weight))
+
+    src = ["def _scorer(snp_calls):", "    get = snp_calls.get", "    results = {}"]
+    for domain, snps in domains.items():
+        src += ["    num = 0.0", "    den = 0.0", "    tested = 0"]
+        for rsid, weight in snps:
+            src += [
+                f"    c = get({rsid!r})",
+                "    if c is not None and c['status'] == 'found':",
+                "        r = _raw(c['risk_count'])",
+                "        if r is not None:",
+                f"            num += r * {weight!r}",
+                f"            den += {weight!r}",
+                "            tested += 1",
+            ]
+        src += [
+            "    if den > 0:",
+            "        x100 = _x100(num / den)",
+            "    elif tested == 0:",
+            "        x100 = -1",
+            "    else:",
+            "        x100 = 0",
+            "    if x100 < 0:",
+            "        category = 'Unknown'",
+            "    elif x100 < 350:",
+            "        category = 'Low'",
+            "    elif x100 < 650:",
+            "        category = 'Moderate'",
+            "    else:",
+            "        category = 'Elevated'",
+            f"    results[{domain!r}] = {{",
+            "        'score': x100 / 100 if x100 >= 0 else None,",
+            "        'category': category,",
+            "        'tested_snps': tested,",
+            f"        'missing_snps': {len(snps)} - tested,",
+            f"        'coverage': f'{{tested}}/{len(snps)} SNPs tested',",
+            "    }",
+        ]
+    src.append("    return results")
+
+    namespace = {"_raw": snp_raw_score, "_x100": _score_x100}
+    exec(compile("\n".join(src), "<nutrigx-scorer>", "exec"), namespace)
+    return namespace["_scorer"]
@@ -0,0 +1,43 @@
+"""
+conftest.py — Shared fixtures for the NutriGx Advisor test suite
+
+The panel and the fixed synthetic patient are loaded, parsed and scored
+once per session; individual tests only assert on the results.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parse_input import parse_genetic_file
+from extract_genotypes import extract_snp_genotypes
+from score_variants import compute_nutrient_risk_scores
+
+
+SYNTHETIC = Path(__file__).parent / "synthetic_patient.csv"
+PANEL     = Path(__file__).parent.parent / "data" / "snp_panel.json"
+
+
+@pytest.fixture(scope="session")
+def panel():
+    with open(PANEL) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def table():
+    return parse_genetic_file(str(SYNTHETIC), fmt="23andme")
+
+
+@pytest.fixture(scope="session")
+def calls(table, panel):
+    return extract_snp_genotypes(table, panel)
+
+
+@pytest.fixture(scope="session")
+def scores(calls, panel):
+    return compute_nutrient_risk_scores(calls, panel)
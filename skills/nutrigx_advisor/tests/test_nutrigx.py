@@ -3,88 +3,78 @@ test_nutrigx.py — Automated test suite for NutriGx Advisor
 Run with: pytest tests/test_nutrigx.py -v
 
 Uses a FIXED synthetic patient (synthetic_patient.csv) with known genotypes
-so that all assertions are deterministic and reproducible. This file is NOT
+so that all assertions are deterministic and reproducible. The patient is
+parsed and scored once per session by the fixtures in conftest.py. This file is NOT
 meant to showcase the skill — use examples/generate_patient.py for varied demos.
 """
 
-import json
 import sys
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from parse_input import parse_genetic_file
-from extract_genotypes import extract_snp_genotypes
-from score_variants import compute_nutrient_risk_scores
+from score_variants import (
+    build_panel_arrays,
+    compute_batch_scores,
+    compile_scorer,
+    compute_nutrient_risk_scores,
+    score_cohort,
+    to_dosage_array,
+)
 
 
 SYNTHETIC = Path(__file__).parent / "synthetic_patient.csv"
-PANEL     = Path(__file__).parent.parent / "data" / "snp_panel.json"
-
-
-def load_panel():
-    with open(PANEL) as f:
-        return json.load(f)
 
 
 # ── Parsing ────────────────────────────────────────────────────────────────────
 
-def test_parse_23andme():
-    table = parse_genetic_file(str(SYNTHETIC), fmt="23andme")
+def test_parse_23andme(table):
     assert len(table) >= 20
     assert "rs1801133" in table
     assert table["rs1801133"] in ("CT", "TC")
 
 
-def test_all_panel_snps_present():
-    panel = load_panel()
-    table = parse_genetic_file(str(SYNTHETIC), fmt="23andme")
-    calls = extract_snp_genotypes(table, panel)
-    genotyped = sum(1 for v in calls.values() if v["status"] in ("found", "allele_mismatch"))
+def test_parse_keep_filters_to_panel():
+    keep = {"rs1801133", "rs731236", "rs0000000"}
+    table = parse_genetic_file(str(SYNTHETIC), fmt="23andme", keep=keep)
+    assert set(table) == {"rs1801133", "rs731236"}
+
+
+def test_all_panel_snps_present(panel, calls):
+    genotyped = calls.counts["found"] + calls.counts["allele_mismatch"]
     assert genotyped == len(panel), f"Expected all {len(panel)} SNPs genotyped, got {genotyped}"
 
 
 # ── Extraction ─────────────────────────────────────────────────────────────────
 
-def test_mthfr_heterozygous():
-    """Fixed patient has MTHFR C677T = CT (1 risk allele)."""
-    panel = load_panel()
-    table = parse_genetic_file(str(SYNTHETIC), fmt="23andme")
-    calls = extract_snp_genotypes(table, panel)
-    mthfr = calls["rs1801133"]
-    assert mthfr["status"] == "found"
-    assert mthfr["risk_count"] == 1
-
-
-def test_vdr_homozygous_risk():
-    """Fixed patient has VDR TaqI = CC (2 risk alleles) → drives Elevated vitamin D score."""
-    panel = load_panel()
-    table = parse_genetic_file(str(SYNTHETIC), fmt="23andme")
-    calls = extract_snp_genotypes(table, panel)
-    vdr = calls["rs731236"]
-    assert vdr["status"] == "found"
-    assert vdr["risk_count"] == 2
-
-
-def test_aldh2_ref_homozygous():
-    """Fixed patient has ALDH2 = GG (0 risk alleles). Flagged as allele_mismatch
-    because GG doesn't contain risk allele A even after strand flip."""
-    panel = load_panel()
-    table = parse_genetic_file(str(SYNTHETIC), fmt="23andme")
-    calls = extract_snp_genotypes(table, panel)
-    aldh2 = calls["rs671"]
-    assert aldh2["status"] in ("found", "allele_mismatch")
-    # allele_mismatch sets risk_count to None; found sets it to 0
-    assert aldh2["risk_count"] in (0, None)
+# Expected calls for the fixed patient: (rsid, allowed statuses, allowed risk counts)
+SNP_CASES = [
+    # MTHFR C677T = CT (1 risk allele)
+    ("rs1801133", ("found",), (1,)),
+    # VDR TaqI = CC (2 risk alleles) → drives Elevated vitamin D score
+    ("rs731236", ("found",), (2,)),
+    # ALDH2 = GG (0 risk alleles). Flagged as allele_mismatch because GG
+    # doesn't contain risk allele A even after strand flip; allele_mismatch
+    # sets risk_count to None, found sets it to 0
+    ("rs671", ("found", "allele_mismatch"), (0, None)),
+]
+
+
+@pytest.mark.parametrize("rsid,statuses,risk_counts", SNP_CASES)
+def test_snp_call(calls, rsid, statuses, risk_counts):
+    call = calls[rsid]
+    assert call["status"] in statuses
+    assert call["risk_count"] in risk_counts
 
 
 # ── Scoring ────────────────────────────────────────────────────────────────────
 
-def test_scores_structure():
-    panel = load_panel()
-    table = parse_genetic_file(str(SYNTHETIC), fmt="23andme")
-    calls = extract_snp_genotypes(table, panel)
-    scores = compute_nutrient_risk_scores(calls, panel)
+def test_scores_structure(scores):
     assert "folate" in scores
     assert "vitamin_d" in scores
     assert "omega3" in scores
@@ -95,29 +85,93 @@ def test_scores_structure():
         assert data["category"] in ("Low", "Moderate", "Elevated", "Unknown")
 
 
-def test_vitamin_d_elevated():
+def test_vitamin_d_elevated(scores):
     """VDR TaqI hom risk → Vitamin D expected Elevated."""
-    panel = load_panel()
-    table = parse_genetic_file(str(SYNTHETIC), fmt="23andme")
-    calls = extract_snp_genotypes(table, panel)
-    scores = compute_nutrient_risk_scores(calls, panel)
     assert scores["vitamin_d"]["category"] == "Elevated"
 
 
-def test_alcohol_low_or_moderate():
+def test_alcohol_low_or_moderate(scores):
     """ALDH2 GG ref hom → Alcohol expected Low or Moderate (allele_mismatch
     may inflate score slightly since the SNP contribution is uncertain)."""
-    panel = load_panel()
-    table = parse_genetic_file(str(SYNTHETIC), fmt="23andme")
-    calls = extract_snp_genotypes(table, panel)
-    scores = compute_nutrient_risk_scores(calls, panel)
     assert scores["alcohol"]["category"] in ("Low", "Moderate")
 
 
-def test_folate_not_low():
+def test_folate_not_low(scores):
     """MTHFR C677T het → Folate should be Moderate or Elevated, not Low."""
-    panel = load_panel()
-    table = parse_genetic_file(str(SYNTHETIC), fmt="23andme")
-    calls = extract_snp_genotypes(table, panel)
-    scores = compute_nutrient_risk_scores(calls, panel)
     assert scores["folate"]["category"] in ("Moderate", "Elevated")
+
+
+def test_scores_without_detail(panel, calls, scores):
+    summary = compute_nutrient_risk_scores(calls, panel, detail=False)
+    for domain, data in summary.items():
+        assert "contributing_snps" not in data
+        assert data["score"] == scores[domain]["score"]
+        assert data["category"] == scores[domain]["category"]
+
+
+def test_compiled_scorer_matches(panel, calls):
+    scorer = compile_scorer(panel)
+    assert scorer is compile_scorer(panel)
+    assert scorer(calls) == compute_nutrient_risk_scores(calls, panel, detail=False)
+
+
+def test_scores_with_no_calls(panel):
+    empty = compute_nutrient_risk_scores({}, panel)
+    assert sum(d["missing_snps"] for d in empty.values()) == len(panel)
+    for data in empty.values():
+        assert data["score"] is None
+        assert data["category"] == "Unknown"
+        assert data["contributing_snps"] == []
+
+
+def test_batch_scores_match_single_patient(panel, calls, scores):
+    arrays = build_panel_arrays(panel)
+    assert compute_nutrient_risk_scores(calls, arrays) == scores
+    row = to_dosage_array(calls, arrays)
+    batch = compute_batch_scores(np.stack([row, row]), arrays)
+    for d, domain in enumerate(arrays.domain_names):
+        expected = scores[domain]["score"]
+        if expected is None:
+            assert np.isnan(batch[:, d]).all()
+        else:
+            assert (batch[:, d] == expected).all()
+
+
+def test_all_paths_round_ties_alike():
+    # 0.5 * 0.51 / (0.51 + 0.69) = 0.21250000000000002: a near-tie that
+    # round(x * 1000) and np.round(x * 10, 2) used to send different ways
+    tie_panel = [
+        {"rsid": "rs1", "gene": "G1", "nutrient_domain": "d", "weight": 0.51},
+        {"rsid": "rs2", "gene": "G2", "nutrient_domain": "d", "weight": 0.69},
+    ]
+    calls = {
+        "rs1": {"status": "found", "risk_count": 1, "normalised": "AG"},
+        "rs2": {"status": "found", "risk_count": 0, "normalised": "GG"},
+    }
+    single = compute_nutrient_risk_scores(calls, tie_panel)["d"]["score"]
+    arrays = build_panel_arrays(tie_panel)
+    batch = compute_batch_scores(np.array([[1, 0]], dtype=np.int8), arrays)
+    cohort = score_cohort(
+        pd.DataFrame({"patient_id": ["P1", "P1"], "rsid": ["rs1", "rs2"], "risk_count": [1, 0]}),
+        pd.DataFrame(tie_panel),
+    )
+    assert single == 2.13
+    assert batch[0, 0] == single
+    assert cohort.loc["P1", "d"] == single
+    assert compile_scorer(tie_panel)(calls)["d"]["score"] == single
+
+
+def test_score_cohort_matches_single_patient(panel, calls, scores):
+    found = [
+        {"patient_id": pid, "rsid": rsid, "risk_count": c["risk_count"]}
+        for pid in ("P1", "P2")
+        for rsid, c in calls.items() if c["status"] == "found"
+    ]
+    cohort = score_cohort(pd.DataFrame(found), pd.DataFrame(panel))
+    assert list(cohort.index) == ["P1", "P2"]
+    assert list(cohort.columns) == list(scores)
+    for domain, data in scores.items():
+        if data["score"] is None:
+            assert cohort[domain].isna().all()
+        else:
+            assert (cohort[domain] == data["score"]).all()
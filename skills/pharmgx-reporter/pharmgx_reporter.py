@@ -8,16 +8,34 @@ metabolizer phenotypes, and looks up CPIC drug recommendations for 51 medication
 
 Usage:
     python pharmgx_reporter.py --input patient_data.txt --output report_dir
+    python pharmgx_reporter.py --batch manifest.tsv --output reports_dir
+    python pharmgx_reporter.py --input patient_data.txt --output report_dir --json
 """
 
 import argparse
+import csv
 import hashlib
+import io
+import importlib.util
+import json
+import mmap
 import os
 import re
 import sys
 from datetime import datetime, timezone
+from enum import IntEnum
+from functools import lru_cache, partial
+from itertools import islice
+from multiprocessing import Pool
+from operator import itemgetter
 from pathlib import Path
 
+# pandas is optional and imported on first use: it costs ~0.25 s, which is
+# most of this module's import time.
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+# orjson, when installed, serializes --json output straight to bytes
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+
 # ---------------------------------------------------------------------------
 # 1. PGx SNP definitions (ported from PharmXD snp-parser.js)
 # ---------------------------------------------------------------------------
@@ -255,6 +273,93 @@ GENE_DEFS = {
     },
 }
 
+
+class Effect(IntEnum):
+    """Variant function codes used internally by the star allele caller.
+
+    The tables and the report keep the lower-case strings ("no_function", ...);
+    ``Effect[name.upper()]`` converts.
+    """
+    NO_FUNCTION = 0
+    DECREASED_FUNCTION = 1
+    NORMAL_FUNCTION = 2
+    INCREASED_FUNCTION = 3
+    DECREASED_EXPRESSION = 4
+
+
+def _intern_all(obj):
+    """Return a copy of obj with every str key and value interned."""
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return {_intern_all(k): _intern_all(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_intern_all(v) for v in obj)
+    return obj
+
+
+# Gene, allele, phenotype and diplotype strings are hashed on every report;
+# interning them once lets dict probes short-circuit on identity.
+PGX_SNPS = _intern_all(PGX_SNPS)
+GENE_DEFS = _intern_all(GENE_DEFS)
+
+def _canon(diplotype):
+    """Order-independent key for an upper-cased diplotype: "*2/*1" -> ("*1", "*2").
+
+    Single-call genotypes ("GA") become 1-tuples and are left as written.
+    """
+    pair = diplotype.split("/")
+    if len(pair) == 2 and pair[1] < pair[0]:
+        return pair[1], pair[0]
+    return tuple(pair)
+
+
+# Freeze phenotype rules and index every diplotype by its canonical allele
+# pair, so call_phenotype is a single tuple probe whichever order the
+# alleles come in. setdefault keeps the first match in declaration order,
+# as the original linear scan did.
+for _gdef in GENE_DEFS.values():
+    _index = {}
+    for _desc, _dips in _gdef["phenotypes"].items():
+        for _dip in _dips:
+            _index.setdefault(tuple(sys.intern(a) for a in _canon(_dip.upper())), _desc)
+    _gdef["phenotypes"] = {desc: frozenset(dips) for desc, dips in _gdef["phenotypes"].items()}
+    _gdef["_pair_index"] = _index
+    # Flat (rsid, allele, ALT, Effect) rows for the call_diplotype loop
+    _gdef["_variant_rows"] = tuple(
+        (rsid, v["allele"], v["alt"].upper(), Effect[v["effect"].upper()])
+        for rsid, v in _gdef["variants"].items()
+    )
+del _gdef, _index, _desc, _dips, _dip
+
+# gene -> allele-pair phenotype index, so call_phenotype skips the GENE_DEFS hop
+_PHENO_INDEX = {gene: gdef["_pair_index"] for gene, gdef in GENE_DEFS.items()}
+
+# gene -> rsid set, so call_diplotype can rule out an untested gene in C
+_GENE_RSID_SET = {gene: frozenset(gdef["variants"]) for gene, gdef in GENE_DEFS.items()}
+
+# Flat rsid -> (gene, allele, alt, effect) index: one dict probe per line
+# while parsing instead of PGX_SNPS plus a GENE_DEFS variants lookup.
+RSID_INDEX = {
+    rs: (info["gene"], info["allele"], GENE_DEFS[info["gene"]]["variants"][rs]["alt"], info["effect"])
+    for rs, info in PGX_SNPS.items()
+}
+RSID_SET = frozenset(PGX_SNPS)
+# Panel rsids grouped by gene (stable, so PGX_SNPS order within a gene):
+# the Detected Variants table walks this instead of sorting per report
+RSIDS_BY_GENE = tuple(sorted(PGX_SNPS, key=lambda rs: PGX_SNPS[rs]["gene"]))
+
+# Alt-allele dose of a two-base ASCII genotype, indexed by
+# ord(b1) << 8 | ord(b2), for every single-base alt in GENE_DEFS.
+DOSE_TABLE = {}
+for _alt in {alt for _, _, alt, _ in RSID_INDEX.values() if len(alt) == 1}:
+    _table = bytearray(1 << 16)
+    for _c in range(128):
+        _table[ord(_alt) << 8 | _c] += 1
+        _table[_c << 8 | ord(_alt)] += 1
+    DOSE_TABLE[_alt] = bytes(_table)
+del _alt, _table, _c
+
 # ---------------------------------------------------------------------------
 # 3. CPIC drug guidelines (from cpic-lookup.js, all 51 drugs)
 # ---------------------------------------------------------------------------
@@ -267,9 +372,10 @@ GENE_DEFS = {
 # For SLCO1B1: normal_function, intermediate_function, poor_function
 # For CYP3A5: extensive_metabolizer, intermediate_metabolizer, poor_metabolizer
 
+@lru_cache(maxsize=64)
 def _pheno_key(description):
     """Convert phenotype description to lookup key."""
-    return description.lower().replace(" ", "_")
+    return sys.intern(description.lower().replace(" ", "_"))
 
 
 GUIDELINES = {
@@ -721,61 +827,290 @@ GUIDELINES = {
         },
     },
 }
+GUIDELINES = _intern_all(GUIDELINES)
+
+
+def _validate_schema(gene_defs=GENE_DEFS, guidelines=GUIDELINES):
+    """Check the panel tables once at import, so a bad edit fails on load."""
+    for gene, gdef in gene_defs.items():
+        if len(gdef.get("phenotypes", ())) < 2:
+            raise ValueError(f"{gene} has fewer than 2 phenotypes")
+    for drug, info in guidelines.items():
+        for gene in info.get("genes", [info.get("gene")]):
+            if gene not in gene_defs:
+                raise ValueError(f"{drug} references unknown gene {gene}")
+
+
+_validate_schema()
+
+# Columnar view of GUIDELINES: parallel per-drug tuples, zipped once into
+# _DRUG_ROWS so lookup_drugs unpacks a tuple per drug instead of dict gets.
+DRUG_NAMES = tuple(GUIDELINES)
+DRUG_BRANDS = tuple(g["brand"] for g in GUIDELINES.values())
+DRUG_CLASSES = tuple(g["class"] for g in GUIDELINES.values())
+DRUG_GENES = tuple(g.get("gene") or "+".join(g["genes"]) for g in GUIDELINES.values())
+DRUG_SPECIAL = tuple(g.get("special") for g in GUIDELINES.values())
+_DRUG_ROWS = tuple(zip(
+    DRUG_NAMES, DRUG_BRANDS, DRUG_CLASSES, DRUG_GENES, DRUG_SPECIAL,
+    (g.get("recs", {}) for g in GUIDELINES.values()),
+))
+
+# gene -> indices into DRUG_NAMES of the drugs that depend on it
+DRUGS_BY_GENE = {}
+for _i, _g in enumerate(GUIDELINES.values()):
+    for _gene in _g.get("genes", [_g.get("gene")]):
+        DRUGS_BY_GENE.setdefault(_gene, []).append(_i)
+DRUGS_BY_GENE = {gene: tuple(ids) for gene, ids in DRUGS_BY_GENE.items()}
+del _i, _g, _gene
 
 
 # ---------------------------------------------------------------------------
 # 4. File parser
 # ---------------------------------------------------------------------------
 
+# Header patterns in detect_format's priority order; the first matching line wins
+_HEADER_RE = re.compile(
+    r"^(?:(?P<t># rsid)"
+    r"|(?=[^\n]*RSID)(?=[^\n]*CHROMOSOME)(?P<a>)"
+    r"|(?=[^\n]*rsid)(?=[^\n]*chromosome)(?P<g>))",
+    re.M,
+)
+# First rs data line with at least four tab- (or else comma-) separated fields
+_DATA_RE = re.compile(
+    r"^rs(?:[^\t\n]*(?:\t[^\t\n]*){3}(?P<t>)|[^,\n]*(?:,[^,\n]*){3}(?P<a>))",
+    re.M,
+)
+_FMT_GROUPS = {"t": "23andme", "a": "ancestrydna", "g": "generic"}
+
+
 def detect_format(lines):
-    for line in lines[:20]:
-        if line.startswith("# rsid"):
-            return "23andme"
-        if "RSID" in line and "CHROMOSOME" in line:
-            return "ancestrydna"
-        if "rsid" in line and "chromosome" in line:
-            return "generic"
-    for line in lines[:20]:
-        if line.startswith("#") or line.strip() == "":
-            continue
-        parts = line.split("\t")
-        if len(parts) >= 4 and parts[0].startswith("rs"):
-            return "23andme"
-        parts = line.split(",")
-        if len(parts) >= 4 and parts[0].startswith("rs"):
-            return "ancestrydna"
-    return "unknown"
+    head = "\n".join(lines[:20])
+    m = _HEADER_RE.search(head) or _DATA_RE.search(head)
+    return _FMT_GROUPS[m.lastgroup] if m else "unknown"
+
+
+def _scan_lines(path):
+    """Line-by-line fallback for comma-separated or irregular files.
+
+    Streams the file through a 1 MiB buffer; each line keeps its trailing
+    newline, which the strip() calls below already discard.
+    """
+    seen = set()
+    hits = {}
+    with open(path, buffering=1 << 20) as f:
+        for line in f:
+            # Only rows whose first field is an rs id can count; this also drops
+            # comments and blank lines with one C-level prefix test.
+            if not line.startswith("rs") and not line.lstrip().startswith("rs"):
+                continue
+            # Five splits are enough to tell 4, 5 and 6+ column rows apart
+            parts = line.split("\t", 5) if "\t" in line else line.split(",", 5)
+            if len(parts) >= 4:
+                rsid = parts[0].strip()
+                if not rsid.startswith("rs"):
+                    continue
+                if len(parts) == 5:
+                    genotype = parts[3].strip() + parts[4].strip()
+                else:
+                    genotype = parts[3].strip()
+                if not genotype or genotype in ("--", "00"):
+                    continue
+                # Header test last: it only matters for rows that would count
+                low = line.lower()
+                if "rsid" in low and "chromosome" in low:
+                    continue
+                seen.add(rsid)
+                if rsid in RSID_SET:
+                    hits[rsid] = genotype.upper()
+    return len(seen), hits
+
+
+def _has_rs_header(buf):
+    """True when an rs line mentions both "rsid" and "chromosome".
+
+    _scan_lines skips such lines as column headers (any case), which the
+    regex scans cannot express, so their callers defer to it instead.
+    """
+    low = bytes(buf).lower()
+    i = low.find(b"chromosome")
+    while i != -1:
+        start = low.rfind(b"\n", 0, i) + 1
+        end = low.find(b"\n", i)
+        line = low[start:] if end == -1 else low[start:end]
+        if line.lstrip().startswith(b"rs") and b"rsid" in line:
+            return True
+        if end == -1:
+            break
+        i = low.find(b"chromosome", end)
+    return False
+
+
+# One match per plain 4-column "rsid<TAB>chrom<TAB>pos<TAB>genotype" row
+_CALL_RE = re.compile(rb"^(rs\S*)\t[^\t\n]*\t[^\t\n]*\t(\S*)\r?$", re.M)
+# Every line that _scan_lines would treat as an rs row
+_RS_LINE_RE = re.compile(rb"[ \t\r\f\v]*rs")
+_RS_NEXT_LINE_RE = re.compile(rb"\n[ \t\r\f\v]*rs")
+# A CR not followed by LF: old Mac line endings, which the ^/\n anchors miss
+_LONE_CR_RE = re.compile(rb"\r(?!\n)")
+_NO_CALLS = (b"", b"--", b"00")
+RSID_BYTES = tuple(rs.encode() for rs in PGX_SNPS)
+
+
+def _scan_buffer(buf):
+    """Regex sweep over a 23andMe file held in a bytes-like buffer.
+
+    Returns None when any rs line is not a plain 4-column row or is a
+    column header, when the buffer has CR-only line endings or no rs lines
+    at all, so the caller can fall back to _scan_lines.
+    """
+    if _LONE_CR_RE.search(buf) or _has_rs_header(buf):
+        return None
+    # Every row feeds the "Total SNPs in file" count, so filtering on
+    # an alternation of the PGx rsids would add a pass, not save one.
+    rows = _CALL_RE.findall(buf)
+    rs_lines = len(_RS_NEXT_LINE_RE.findall(buf)) + (_RS_LINE_RE.match(buf) is not None)
+    if len(rows) != rs_lines or (not rs_lines and len(buf)):
+        return None
+    # Last called row wins for duplicate rsids, as in _scan_lines
+    calls = dict(row for row in rows if row[1] not in _NO_CALLS)
+    # Upper-case in byte space; only non-ASCII genotypes need str.upper()
+    hits = {}
+    for rs in RSID_BYTES:
+        gt = calls.get(rs)
+        if gt is not None:
+            hits[rs.decode()] = gt.upper().decode() if gt.isascii() else gt.decode().upper()
+    return len(calls), hits
+
+
+def _scan_mmap(path):
+    """_scan_buffer over a memory-mapped file; no pandas needed."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0, {}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _scan_buffer(mm)
+
+
+def _leading_comments(path):
+    """Return (n, fields): the number of leading "#"/blank lines and the
+    tab-separated field count of the first line after them (0 if none)."""
+    n = 0
+    with open(path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.startswith("#") or not line.strip():
+                n += 1
+                continue
+            return n, line.count("\t") + 1
+    return n, 0
+
+
+def load_calls(path):
+    """Read a tab-separated 23andMe file with pandas.
+
+    Accepts rsid/chromosome/position/genotype rows, or the 5-column
+    variant with the two alleles in separate columns (joined as
+    _scan_lines does). Only the leading lines that start with "#" are
+    skipped, so a "#" inside a data row is kept.
+
+    Returns (total_snps, calls) where calls maps each rsid in RSID_SET to
+    its upper-cased genotype, or None when the file is not uniformly in
+    one of those shapes (other delimiters, short rows, an uncommented
+    column header) so the caller can fall back to the scanners. Raises pandas.errors.ParserError, a
+    ValueError, when a later row has more fields than the first.
+    """
+    import pandas as pd
+
+    skip, n_fields = _leading_comments(path)
+    if n_fields not in (4, 5):
+        return None
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _LONE_CR_RE.search(mm) or _has_rs_header(mm):
+                return None
+    # No usecols: it would silently drop the extra fields of a longer row,
+    # where reading every column makes the C parser raise instead
+    df = pd.read_csv(
+        path, sep="\t", header=None, skiprows=skip, dtype=str,
+        keep_default_na=False, quoting=csv.QUOTE_NONE, engine="c",
+        on_bad_lines="error",
+    )
+    rsid = df[0].str.strip()
+    is_rs = rsid.str.startswith("rs").to_numpy()
+    # A comma-separated or short rs row lands in column 0 with no position
+    if (df[2].to_numpy()[is_rs] == "").any():
+        return None
+    if n_fields == 4:
+        genotype = df[3].astype("category")
+    else:
+        genotype = (df[3].str.strip() + df[4].str.strip()).astype("category")
+    # Genotypes take a handful of distinct values, so normalise the
+    # categories and index back by code rather than touching every row.
+    codes = genotype.cat.codes.to_numpy()
+    genotypes = genotype.cat.categories.str.strip().str.upper()
+    called = ~genotypes.isin(("", "--", "00"))
+    valid = is_rs & called[codes]
+    rsid, codes = rsid[valid], codes[valid]
+    hits = rsid.isin(RSID_SET).to_numpy()
+    return rsid.nunique(), dict(zip(rsid[hits], genotypes[codes[hits]]))
 
 
-def parse_file(path):
-    content = Path(path).read_text()
-    lines = content.split("\n")
-    fmt = detect_format(lines)
+def _sniff_format(path):
+    with open(path) as f:
+        return detect_format([line.rstrip("\n") for line in islice(f, 20)])
 
-    snps = {}
-    for line in lines:
-        if line.startswith("#") or line.strip() == "":
-            continue
-        if "rsid" in line.lower() and "chromosome" in line.lower():
-            continue
-        parts = line.split("\t") if "\t" in line else line.split(",")
-        if len(parts) >= 4:
-            rsid = parts[0].strip()
-            if not rsid.startswith("rs"):
-                continue
-            if len(parts) == 5:
-                genotype = parts[3].strip() + parts[4].strip()
-            else:
-                genotype = parts[3].strip()
-            if genotype and genotype not in ("--", "00"):
-                snps[rsid] = genotype.upper()
 
+def _pgx_from_hits(hits):
+    # Emit in PGX_SNPS order so downstream output is independent of file order
     pgx = {}
-    for rsid, info in PGX_SNPS.items():
-        if rsid in snps:
-            pgx[rsid] = {"genotype": snps[rsid], **info}
+    for rsid, (gene, allele, _alt, effect) in RSID_INDEX.items():
+        if rsid in hits:
+            pgx[rsid] = {"genotype": hits[rsid], "gene": gene, "allele": allele, "effect": effect}
+    return pgx
 
-    return fmt, len(snps), pgx
+
+def parse_file(path):
+    fmt = _sniff_format(path)
+
+    hits = None
+    if HAS_PANDAS and fmt == "23andme":
+        # pandas' ParserError and EmptyDataError (and UnicodeDecodeError)
+        # are ValueErrors; any of them means "let the scanners handle it"
+        try:
+            loaded = load_calls(path)
+        except ValueError:
+            loaded = None
+        if loaded is not None:
+            total, hits = loaded
+    if hits is None and fmt == "23andme":
+        scanned = _scan_mmap(path)
+        if scanned is not None:
+            total, hits = scanned
+    if hits is None:
+        total, hits = _scan_lines(path)
+
+    return fmt, total, _pgx_from_hits(hits)
+
+
+def parse_and_hash(path):
+    """parse_file plus the input's SHA-256, reading the file once where possible.
+
+    A 23andMe file is memory-mapped once; the checksum and the regex scan
+    both run over that mapping. Other inputs fall back to parse_file.
+    Returns (fmt, total_snps, pgx_snps, checksum).
+    """
+    fmt = _sniff_format(path)
+    checksum = None
+    if fmt == "23andme":
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    checksum = hashlib.sha256(mm).hexdigest()
+                    scanned = _scan_buffer(mm)
+                if scanned is not None:
+                    total, hits = scanned
+                    return fmt, total, _pgx_from_hits(hits), checksum
+    fmt, total, pgx = parse_file(path)
+    return fmt, total, pgx, checksum or file_sha256(path)
 
 
 # ---------------------------------------------------------------------------
@@ -791,44 +1126,52 @@ def call_diplotype(gene, pgx_snps):
             return pgx_snps[rsid]["genotype"]
         return "NOT_TESTED"
 
-    # Count how many of this gene's SNPs were actually present in the file
-    gene_rsids = list(gdef["variants"].keys())
-    tested = [r for r in gene_rsids if r in pgx_snps]
-
-    if not tested:
+    # Which of this gene's SNPs were actually present in the file
+    hits = _GENE_RSID_SET[gene].intersection(pgx_snps)
+    if not hits:
         return "NOT_TESTED"
 
+    # Walk rows in declaration order, which decides allele placement; a
+    # fully covered gene (the usual case) needs no filtering at all
+    rows = gdef["_variant_rows"]
+    n_variants, n_tested = len(rows), len(hits)
+    if n_tested < n_variants:
+        rows = [row for row in rows if row[0] in hits]
+
     detected = []
-    for rsid, vdef in gdef["variants"].items():
-        if rsid in pgx_snps:
-            gt = pgx_snps[rsid]["genotype"]
-            alt = vdef["alt"].upper()
-            if alt in ("DEL", "INS", "TA7"):
-                print(f"  WARNING: {gene} {rsid} has structural variant "
-                      f"alt={alt}, cannot interpret from DTC data",
-                      file=sys.stderr)
-                continue
+    for rsid, allele, alt, effect in rows:
+        gt = pgx_snps[rsid]["genotype"]
+        if alt in ("DEL", "INS", "TA7"):
+            print(f"  WARNING: {gene} {rsid} has structural variant "
+                  f"alt={alt}, cannot interpret from DTC data",
+                  file=sys.stderr)
+            continue
+        table = DOSE_TABLE.get(alt)
+        if table is not None and len(gt) == 2 and gt.isascii():
+            alt_count = table[ord(gt[0]) << 8 | ord(gt[1])]
+        else:
             alt_count = gt.count(alt)
-            if alt_count > 0:
-                detected.append({"rsid": rsid, "allele": vdef["allele"],
-                                 "copies": alt_count, "effect": vdef["effect"]})
+        if alt_count > 0:
+            detected.append({"rsid": rsid, "allele": allele,
+                             "copies": alt_count, "effect": effect,
+                             "eff_rank": 0 if effect is Effect.NO_FUNCTION else 1})
 
     if gdef.get("type") == "dpyd":
         if not detected:
-            if len(tested) == len(gene_rsids):
+            if n_tested == n_variants:
                 return "Normal/Normal"
-            return f"Normal/Normal ({len(tested)}/{len(gene_rsids)} SNPs tested)"
+            return f"Normal/Normal ({n_tested}/{n_variants} SNPs tested)"
         v = detected[0]
         if v["copies"] == 2:
             return f"{v['allele']}/{v['allele']}"
         return f"Normal/{v['allele']}"
 
     if not detected:
-        if len(tested) == len(gene_rsids):
+        if n_tested == n_variants:
             return f"{gdef['ref']}/{gdef['ref']}"
-        return f"{gdef['ref']}/{gdef['ref']} ({len(tested)}/{len(gene_rsids)} SNPs tested)"
+        return f"{gdef['ref']}/{gdef['ref']} ({n_tested}/{n_variants} SNPs tested)"
 
-    detected.sort(key=lambda v: (0 if v["effect"] == "no_function" else 1))
+    detected.sort(key=itemgetter("eff_rank"))
 
     a1_parts, a2_parts = [], []
     for v in detected:
@@ -851,19 +1194,12 @@ def call_phenotype(gene, diplotype):
     if diplotype == "NOT_TESTED":
         return "Indeterminate (not genotyped)"
 
-    gdef = GENE_DEFS[gene]
-    norm = diplotype.upper()
-
     # Strip partial-coverage annotations for matching (e.g. "*1/*1 (2/4 SNPs tested)")
-    match_str = norm.split("(")[0].strip()
-
-    for desc, conditions in gdef["phenotypes"].items():
-        for cond in conditions:
-            if match_str == cond.upper():
-                return desc
-            parts = cond.split("/")
-            if len(parts) == 2 and match_str == f"{parts[1]}/{parts[0]}".upper():
-                return desc
+    match_str = diplotype.partition("(")[0].strip().upper()
+
+    desc = _PHENO_INDEX[gene].get(_canon(match_str))
+    if desc is not None:
+        return desc
     return f"Unknown (unmapped diplotype: {diplotype})"
 
 
@@ -871,58 +1207,78 @@ def call_phenotype(gene, diplotype):
 # 6. Drug recommendation lookup
 # ---------------------------------------------------------------------------
 
+_PHENO_KEY_MAP = {
+    "Normal Metabolizer": "normal_metabolizer",
+    "Intermediate Metabolizer": "intermediate_metabolizer",
+    "Poor Metabolizer": "poor_metabolizer",
+    "Ultrarapid Metabolizer": "ultrarapid_metabolizer",
+    "Normal Warfarin Sensitivity": "normal_warfarin_sensitivity",
+    "Intermediate Warfarin Sensitivity": "intermediate_warfarin_sensitivity",
+    "High Warfarin Sensitivity": "high_warfarin_sensitivity",
+    "Normal Function": "normal_function",
+    "Intermediate Function": "intermediate_function",
+    "Poor Function": "poor_function",
+    "CYP3A5 Expressor": "extensive_metabolizer",
+    "Intermediate Expressor": "intermediate_metabolizer",
+    "CYP3A5 Non-expressor": "poor_metabolizer",
+}
+
+
+@lru_cache(maxsize=128)
 def phenotype_to_key(phenotype_desc):
     """Map phenotype description to GUIDELINES rec key."""
-    mapping = {
-        "Normal Metabolizer": "normal_metabolizer",
-        "Intermediate Metabolizer": "intermediate_metabolizer",
-        "Poor Metabolizer": "poor_metabolizer",
-        "Ultrarapid Metabolizer": "ultrarapid_metabolizer",
-        "Normal Warfarin Sensitivity": "normal_warfarin_sensitivity",
-        "Intermediate Warfarin Sensitivity": "intermediate_warfarin_sensitivity",
-        "High Warfarin Sensitivity": "high_warfarin_sensitivity",
-        "Normal Function": "normal_function",
-        "Intermediate Function": "intermediate_function",
-        "Poor Function": "poor_function",
-        "CYP3A5 Expressor": "extensive_metabolizer",
-        "Intermediate Expressor": "intermediate_metabolizer",
-        "CYP3A5 Non-expressor": "poor_metabolizer",
-    }
     # Try exact match first, then strip qualifiers like "(inferred)"
-    key = mapping.get(phenotype_desc)
+    key = _PHENO_KEY_MAP.get(phenotype_desc)
     if key:
         return key
     stripped = phenotype_desc.split("(")[0].strip() if "(" in phenotype_desc else phenotype_desc
-    key = mapping.get(stripped)
+    key = _PHENO_KEY_MAP.get(stripped)
     if key:
         return key
     # Try prefix match: "Normal" → "Normal Metabolizer"
-    for label, val in mapping.items():
+    for label, val in _PHENO_KEY_MAP.items():
         if label.startswith(stripped):
             return val
     return "indeterminate"
 
 
+# Phenotype bit flags consulted by the warfarin rule
+PF_MISSING, PF_UNKNOWN, PF_NORMAL, PF_POOR, PF_HIGH = 1, 2, 4, 8, 16
+
+
+@lru_cache(maxsize=64)
+def _pheno_flags(phenotype):
+    """Classify a phenotype description once into PF_* bits."""
+    low = phenotype.lower()
+    flags = 0
+    if not phenotype or "indeterminate" in low or "not genotyped" in low:
+        flags |= PF_MISSING
+    if "unknown" in low:
+        flags |= PF_UNKNOWN
+    if "normal" in low:
+        flags |= PF_NORMAL
+    if "poor" in low:
+        flags |= PF_POOR
+    if "high" in low:
+        flags |= PF_HIGH
+    return flags
+
+
 def get_warfarin_rec(profiles):
-    cyp2c9_data = profiles.get("CYP2C9", {})
-    vkorc1_data = profiles.get("VKORC1", {})
-    cyp2c9 = cyp2c9_data.get("phenotype", "")
-    vkorc1 = vkorc1_data.get("phenotype", "")
+    cyp2c9 = _pheno_flags(profiles.get("CYP2C9", {}).get("phenotype", ""))
+    vkorc1 = _pheno_flags(profiles.get("VKORC1", {}).get("phenotype", ""))
 
     # If either gene was not genotyped, we cannot provide warfarin guidance
-    if "indeterminate" in cyp2c9.lower() or "not genotyped" in cyp2c9.lower() or not cyp2c9:
+    if cyp2c9 & PF_MISSING:
         return "indeterminate", "CYP2C9 not genotyped. Cannot provide genotype-guided warfarin dosing. Clinical testing recommended."
-    if "indeterminate" in vkorc1.lower() or "not genotyped" in vkorc1.lower() or not vkorc1:
+    if vkorc1 & PF_MISSING:
         return "indeterminate", "VKORC1 not genotyped. Cannot provide genotype-guided warfarin dosing. Clinical testing recommended."
-    if "unknown" in cyp2c9.lower() or "unknown" in vkorc1.lower():
+    if (cyp2c9 | vkorc1) & PF_UNKNOWN:
         return "indeterminate", "CYP2C9/VKORC1 phenotype could not be determined. Clinical testing recommended."
 
-    cyp2c9_normal = "normal" in cyp2c9.lower()
-    vkorc1_normal = "normal" in vkorc1.lower()
-
-    if cyp2c9_normal and vkorc1_normal:
+    if cyp2c9 & vkorc1 & PF_NORMAL:
         return "standard", "Use warfarin dosing algorithm. Standard dose range expected."
-    elif "poor" in cyp2c9.lower() or "high" in vkorc1.lower():
+    elif cyp2c9 & PF_POOR or vkorc1 & PF_HIGH:
         return "avoid", "Significantly reduce dose (50-80% reduction). Consider DOAC alternative."
     else:
         return "caution", "Reduce initial dose. Use genotype-guided dosing algorithm."
@@ -931,232 +1287,395 @@ def get_warfarin_rec(profiles):
 def lookup_drugs(profiles):
     results = {"standard": [], "caution": [], "avoid": [], "indeterminate": []}
 
-    for drug_name, drug in GUIDELINES.items():
-        if drug.get("special") == "warfarin":
+    # Map each profiled gene's phenotype to a rec key once, not once per drug
+    pheno_keys = {
+        gene: phenotype_to_key(profiles[gene]["phenotype"])
+        for gene in DRUGS_BY_GENE if gene in profiles
+    }
+
+    for drug_name, brand, drug_class, gene, special, recs in _DRUG_ROWS:
+        if special == "warfarin":
             classification, rec = get_warfarin_rec(profiles)
             results.setdefault(classification, []).append({
-                "drug": drug_name, "brand": drug["brand"],
-                "class": drug["class"], "gene": "CYP2C9+VKORC1",
+                "drug": drug_name, "brand": brand,
+                "class": drug_class, "gene": gene,
                 "recommendation": rec, "classification": classification,
             })
             continue
 
-        gene = drug["gene"]
         if gene not in profiles:
             results["indeterminate"].append({
-                "drug": drug_name, "brand": drug["brand"],
-                "class": drug["class"], "gene": gene,
+                "drug": drug_name, "brand": brand,
+                "class": drug_class, "gene": gene,
                 "recommendation": "Gene not profiled. No recommendation available.",
                 "classification": "indeterminate",
             })
             continue
 
-        pheno_key = phenotype_to_key(profiles[gene]["phenotype"])
+        pheno_key = pheno_keys[gene]
 
         if pheno_key == "indeterminate":
             results["indeterminate"].append({
-                "drug": drug_name, "brand": drug["brand"],
-                "class": drug["class"], "gene": gene,
+                "drug": drug_name, "brand": brand,
+                "class": drug_class, "gene": gene,
                 "recommendation": f"Gene phenotype indeterminate ({profiles[gene]['phenotype']}). Cannot assess.",
                 "classification": "indeterminate",
             })
             continue
 
-        recs = drug.get("recs", {})
-
-        if pheno_key in recs:
-            classification, rec = recs[pheno_key]
+        hit = recs.get(pheno_key)
+        if hit is not None:
+            classification, rec = hit
         else:
             classification = "indeterminate"
             rec = f"Phenotype '{profiles[gene]['phenotype']}' not covered by available guidelines. Consult clinical pharmacogenomics."
 
         results.setdefault(classification, []).append({
-            "drug": drug_name, "brand": drug["brand"],
-            "class": drug["class"], "gene": gene,
+            "drug": drug_name, "brand": brand,
+            "class": drug_class, "gene": gene,
             "recommendation": rec, "classification": classification,
         })
 
     return results
 
 
+def drugs_by_name(drug_results):
+    """Index lookup_drugs output as {drug name: (classification, entry)}.
+
+    Kept apart from the results dict so consumers that iterate its values
+    (drug counts, the JSON payload) still see only the category lists.
+    """
+    return {
+        d["drug"]: (cat, d) for cat, drugs in drug_results.items() for d in drugs
+    }
+
+
 # ---------------------------------------------------------------------------
 # 7. Report generator
 # ---------------------------------------------------------------------------
 
+# Status -> label for the drug table; one dict probe per row
 ICON = {"standard": "OK", "caution": "CAUTION", "avoid": "AVOID", "indeterminate": "INSUFFICIENT DATA"}
 
-
-def generate_report(input_path, fmt, total_snps, pgx_snps, profiles, drug_results):
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-    checksum = hashlib.sha256(Path(input_path).read_bytes()).hexdigest()
+# Drug table category order, and the alert categories with their headings
+_TABLE_ORDER = ("avoid", "caution", "indeterminate", "standard")
+_ALERT_HEADINGS = (
+    ("avoid", "**AVOID / USE ALTERNATIVE:**\n\n"),
+    ("caution", "**USE WITH CAUTION:**\n\n"),
+)
+
+# Static report sections, joined once at import and written in a single call
+_DISCLAIMER_AND_METHODS = "".join(line + "\n" for line in (
+    "---",
+    "",
+    "## Disclaimer",
+    "",
+    "This report is for **research and educational purposes only**. "
+    "It is NOT a diagnostic device and should NOT be used to make medication decisions "
+    "without consulting a qualified healthcare professional.",
+    "",
+    "Pharmacogenomic recommendations are based on CPIC guidelines (cpicpgx.org). "
+    "DTC genetic tests have limitations: they may not detect all relevant variants, "
+    "and results should be confirmed by clinical-grade testing before clinical use.",
+    "",
+    "## Methods",
+    "",
+    "- **Tool**: ClawBio PharmGx Reporter v0.1.0",
+    "- **SNP panel**: 31 pharmacogenomic variants across 12 genes",
+    "- **Star allele calling**: Simplified DTC-compatible algorithm (single-SNP per allele)",
+    "- **Phenotype assignment**: CPIC-based diplotype-to-phenotype mapping",
+    "- **Drug guidelines**: 51 drugs from CPIC (cpicpgx.org), simplified for DTC context",
+    "",
+))
+
+# Last section: no newline after the final blank line
+_REFERENCES = "\n".join((
+    "## References",
+    "",
+    "- Corpas, M. (2026). ClawBio. https://github.com/ClawBio/ClawBio",
+    "- CPIC. Clinical Pharmacogenetics Implementation Consortium. https://cpicpgx.org/",
+    "- Caudle, K.E. et al. (2014). Standardizing terms for clinical pharmacogenetic test results. Genet Med, 16(9), 655-663.",
+    "- PharmGKB. https://www.pharmgkb.org/",
+    "",
+))
+
+
+def file_sha256(path):
+    """SHA-256 of a file, hashed straight out of a read-only memory map.
+
+    hashlib reads the mapped pages in place, so there is no read() copy
+    into userspace buffers; empty files cannot be mapped and hash b"".
+    """
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):  # POSIX, Python 3.8+
+                # Let the kernel read ahead aggressively while we hash
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return hashlib.sha256(mm).hexdigest()
+
+
+def report_timestamp():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+
+
+def generate_report(input_path, fmt, total_snps, pgx_snps, profiles, drug_results,
+                    generated_at=None, checksum=None):
+    now = generated_at or report_timestamp()
+    checksum = checksum or file_sha256(input_path)
     fname = Path(input_path).name
 
-    lines = []
-    lines.append("# ClawBio PharmGx Report")
-    lines.append("")
-    lines.append(f"**Date**: {now}")
-    lines.append(f"**Input**: `{fname}`")
-    lines.append(f"**Format detected**: {fmt}")
-    lines.append(f"**Checksum (SHA-256)**: `{checksum}`")
-    lines.append(f"**Total SNPs in file**: {total_snps}")
-    lines.append(f"**Pharmacogenomic SNPs found**: {len(pgx_snps)}/{len(PGX_SNPS)}")
-    lines.append(f"**Genes profiled**: {len(profiles)}")
-    lines.append(f"**Drugs assessed**: {sum(len(v) for v in drug_results.values())}")
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w("# ClawBio PharmGx Report\n\n")
+    w(f"**Date**: {now}\n")
+    w(f"**Input**: `{fname}`\n")
+    w(f"**Format detected**: {fmt}\n")
+    w(f"**Checksum (SHA-256)**: `{checksum}`\n")
+    w(f"**Total SNPs in file**: {total_snps}\n")
+    w(f"**Pharmacogenomic SNPs found**: {len(pgx_snps)}/{len(PGX_SNPS)}\n")
+    w(f"**Genes profiled**: {len(profiles)}\n")
+    w(f"**Drugs assessed**: {sum(len(v) for v in drug_results.values())}\n\n")
+    w("---\n\n")
 
     # Data quality warning
     not_tested = [g for g, p in profiles.items() if p["diplotype"] == "NOT_TESTED"]
     unknown_pheno = [g for g, p in profiles.items()
                      if "unknown" in p["phenotype"].lower() or "indeterminate" in p["phenotype"].lower()]
     if not_tested or unknown_pheno:
-        lines.append("## DATA QUALITY WARNING")
-        lines.append("")
+        w("## DATA QUALITY WARNING\n\n")
         if not_tested:
-            lines.append(f"**{len(not_tested)} gene(s) could not be assessed** because the "
-                         "relevant SNPs were not found in the input file: "
-                         f"{', '.join(not_tested)}")
-            lines.append("")
-            lines.append("Drugs depending on these genes are marked INSUFFICIENT DATA below. "
-                         "Do not assume normal metabolism for untested genes.")
-            lines.append("")
+            w(f"**{len(not_tested)} gene(s) could not be assessed** because the "
+              "relevant SNPs were not found in the input file: "
+              f"{', '.join(not_tested)}\n\n")
+            w("Drugs depending on these genes are marked INSUFFICIENT DATA below. "
+              "Do not assume normal metabolism for untested genes.\n\n")
         if unknown_pheno:
             unmapped = [g for g in unknown_pheno if g not in not_tested]
             if unmapped:
-                lines.append(f"**{len(unmapped)} gene(s) have unmapped diplotypes**: "
-                             f"{', '.join(unmapped)}. These diplotypes could not be matched "
-                             "to a known phenotype. Clinical pharmacogenomic testing is recommended.")
-                lines.append("")
-        lines.append("---")
-        lines.append("")
+                w(f"**{len(unmapped)} gene(s) have unmapped diplotypes**: "
+                  f"{', '.join(unmapped)}. These diplotypes could not be matched "
+                  "to a known phenotype. Clinical pharmacogenomic testing is recommended.\n\n")
+        w("---\n\n")
 
     # Summary counts
     n_std = len(drug_results["standard"])
     n_cau = len(drug_results["caution"])
     n_avo = len(drug_results["avoid"])
     n_ind = len(drug_results.get("indeterminate", []))
-    lines.append("## Drug Response Summary")
-    lines.append("")
-    lines.append(f"| Category | Count |")
-    lines.append(f"|----------|-------|")
-    lines.append(f"| Standard dosing | {n_std} |")
-    lines.append(f"| Use with caution | {n_cau} |")
-    lines.append(f"| Avoid / use alternative | {n_avo} |")
+    w("## Drug Response Summary\n\n")
+    w(f"| Category | Count |\n")
+    w(f"|----------|-------|\n")
+    w(f"| Standard dosing | {n_std} |\n")
+    w(f"| Use with caution | {n_cau} |\n")
+    w(f"| Avoid / use alternative | {n_avo} |\n")
     if n_ind > 0:
-        lines.append(f"| Insufficient data | {n_ind} |")
-    lines.append("")
+        w(f"| Insufficient data | {n_ind} |\n")
+    w("\n")
 
     # Alert drugs
     if n_avo > 0 or n_cau > 0:
-        lines.append("### Actionable Alerts")
-        lines.append("")
-        if n_avo > 0:
-            lines.append("**AVOID / USE ALTERNATIVE:**")
-            lines.append("")
-            for d in drug_results["avoid"]:
-                lines.append(f"- **{d['drug']}** ({d['brand']}) [{d['gene']}]: {d['recommendation']}")
-            lines.append("")
-        if n_cau > 0:
-            lines.append("**USE WITH CAUTION:**")
-            lines.append("")
-            for d in drug_results["caution"]:
-                lines.append(f"- **{d['drug']}** ({d['brand']}) [{d['gene']}]: {d['recommendation']}")
-            lines.append("")
-
-    lines.append("---")
-    lines.append("")
+        w("### Actionable Alerts\n\n")
+        # Alerts keep lookup_drugs (GUIDELINES) order; only the full table is sorted
+        for cat, heading in _ALERT_HEADINGS:
+            if drug_results[cat]:
+                w(heading)
+                buf.writelines(
+                    "- **" + d["drug"] + "** (" + d["brand"] + ") [" + d["gene"] + "]: " + d["recommendation"] + "\n"
+                    for d in drug_results[cat]
+                )
+                w("\n")
+
+    w("---\n\n")
 
     # Gene profiles
-    lines.append("## Gene Profiles")
-    lines.append("")
-    lines.append("| Gene | Full Name | Diplotype | Phenotype |")
-    lines.append("|------|-----------|-----------|-----------|")
+    w("## Gene Profiles\n\n")
+    w("| Gene | Full Name | Diplotype | Phenotype |\n")
+    w("|------|-----------|-----------|-----------|\n")
     for gene in GENE_DEFS:
         if gene in profiles:
             p = profiles[gene]
-            lines.append(f"| {gene} | {GENE_DEFS[gene]['name']} | {p['diplotype']} | {p['phenotype']} |")
-    lines.append("")
+            w(f"| {gene} | {GENE_DEFS[gene]['name']} | {p['diplotype']} | {p['phenotype']} |\n")
+    w("\n")
 
     # Detected variants
-    lines.append("## Detected Variants")
-    lines.append("")
-    lines.append("| rsID | Gene | Star Allele | Genotype | Effect |")
-    lines.append("|------|------|-------------|----------|--------|")
-    for rsid, info in sorted(pgx_snps.items(), key=lambda x: x[1]["gene"]):
-        lines.append(f"| {rsid} | {info['gene']} | {info['allele']} | {info['genotype']} | {info['effect']} |")
-    lines.append("")
+    w("## Detected Variants\n\n")
+    w("| rsID | Gene | Star Allele | Genotype | Effect |\n")
+    w("|------|------|-------------|----------|--------|\n")
+    for rsid in RSIDS_BY_GENE:
+        if rsid not in pgx_snps:
+            continue
+        info = pgx_snps[rsid]
+        w(f"| {rsid} | {info['gene']} | {info['allele']} | {info['genotype']} | {info['effect']} |\n")
+    w("\n")
 
     # Full drug table
-    lines.append("---")
-    lines.append("")
-    lines.append("## Complete Drug Recommendations")
-    lines.append("")
-    lines.append("| Drug | Brand | Class | Gene | Status | Recommendation |")
-    lines.append("|------|-------|-------|------|--------|----------------|")
-    for cat in ["avoid", "caution", "indeterminate", "standard"]:
-        for d in sorted(drug_results.get(cat, []), key=lambda x: x["drug"]):
-            status = ICON.get(d["classification"], d["classification"].upper())
-            lines.append(f"| {d['drug']} | {d['brand']} | {d['class']} | {d['gene']} | {status} | {d['recommendation']} |")
-    lines.append("")
-
-    # Disclaimer
-    lines.append("---")
-    lines.append("")
-    lines.append("## Disclaimer")
-    lines.append("")
-    lines.append("This report is for **research and educational purposes only**. "
-                 "It is NOT a diagnostic device and should NOT be used to make medication decisions "
-                 "without consulting a qualified healthcare professional.")
-    lines.append("")
-    lines.append("Pharmacogenomic recommendations are based on CPIC guidelines (cpicpgx.org). "
-                 "DTC genetic tests have limitations: they may not detect all relevant variants, "
-                 "and results should be confirmed by clinical-grade testing before clinical use.")
-    lines.append("")
-
-    # Methods
-    lines.append("## Methods")
-    lines.append("")
-    lines.append("- **Tool**: ClawBio PharmGx Reporter v0.1.0")
-    lines.append("- **SNP panel**: 31 pharmacogenomic variants across 12 genes")
-    lines.append("- **Star allele calling**: Simplified DTC-compatible algorithm (single-SNP per allele)")
-    lines.append("- **Phenotype assignment**: CPIC-based diplotype-to-phenotype mapping")
-    lines.append("- **Drug guidelines**: 51 drugs from CPIC (cpicpgx.org), simplified for DTC context")
-    lines.append("")
+    w("---\n\n")
+    w("## Complete Drug Recommendations\n\n")
+    w("| Drug | Brand | Class | Gene | Status | Recommendation |\n")
+    w("|------|-------|-------|------|--------|----------------|\n")
+    for cat in _TABLE_ORDER:
+        # lookup_drugs files every drug under its own classification
+        status = ICON[cat]
+        buf.writelines(
+            "| " + " | ".join((d["drug"], d["brand"], d["class"], d["gene"], status, d["recommendation"])) + " |\n"
+            for d in sorted(drug_results.get(cat, []), key=itemgetter("drug"))
+        )
+    w("\n")
+
+    w(_DISCLAIMER_AND_METHODS)
 
     # Reproducibility
-    lines.append("## Reproducibility")
-    lines.append("")
-    lines.append("```bash")
-    lines.append(f"python pharmgx_reporter.py --input {fname} --output report")
-    lines.append("```")
-    lines.append("")
-    lines.append(f"**Input checksum**: `{checksum}`")
-    lines.append("")
-
-    # References
-    lines.append("## References")
-    lines.append("")
-    lines.append("- Corpas, M. (2026). ClawBio. https://github.com/ClawBio/ClawBio")
-    lines.append("- CPIC. Clinical Pharmacogenetics Implementation Consortium. https://cpicpgx.org/")
-    lines.append("- Caudle, K.E. et al. (2014). Standardizing terms for clinical pharmacogenetic test results. Genet Med, 16(9), 655-663.")
-    lines.append("- PharmGKB. https://www.pharmgkb.org/")
-    lines.append("")
-
-    return "\n".join(lines)
+    w("## Reproducibility\n\n")
+    w("```bash\n")
+    w(f"python pharmgx_reporter.py --input {fname} --output report\n")
+    w("```\n\n")
+    w(f"**Input checksum**: `{checksum}`\n\n")
+
+    w(_REFERENCES)
+
+    return buf.getvalue()
 
 
 # ---------------------------------------------------------------------------
 # 8. Main
 # ---------------------------------------------------------------------------
 
+def write_report(output_dir, report):
+    """Write report.md into output_dir as UTF-8 with LF newlines in one call."""
+    outdir = Path(output_dir)
+    outdir.mkdir(parents=True, exist_ok=True)
+    report_path = outdir / "report.md"
+    # write_bytes rather than write_text(newline=...), which needs Python 3.10
+    report_path.write_bytes(report.encode("utf-8"))
+    return report_path
+
+
+def build_json_payload(input_path, fmt, total_snps, pgx_snps, profiles, drug_results,
+                       generated_at=None, checksum=None):
+    """Machine-readable counterpart of generate_report."""
+    return {
+        "meta": {
+            "tool": "ClawBio PharmGx Reporter",
+            "version": "0.1.0",
+            "date": generated_at or report_timestamp(),
+            "input": Path(input_path).name,
+            "format": fmt,
+            "checksum_sha256": checksum or file_sha256(input_path),
+            "total_snps": total_snps,
+            "pgx_snps_found": len(pgx_snps),
+            "pgx_snps_panel": len(PGX_SNPS),
+        },
+        "variants": pgx_snps,
+        "profiles": profiles,
+        "drugs": drug_results,
+    }
+
+
+def write_json_report(output_dir, payload):
+    """Write report.json into output_dir, via orjson when it is installed."""
+    outdir = Path(output_dir)
+    outdir.mkdir(parents=True, exist_ok=True)
+    json_path = outdir / "report.json"
+    if HAS_ORJSON:
+        import orjson
+
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    else:
+        # Same layout as orjson's OPT_INDENT_2
+        data = json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+    json_path.write_bytes(data)
+    return json_path
+
+
+def build_profiles(pgx_snps):
+    """Call diplotype and phenotype for every gene in GENE_DEFS."""
+    profiles = {}
+    for gene in GENE_DEFS:
+        diplotype = call_diplotype(gene, pgx_snps)
+        phenotype = call_phenotype(gene, diplotype)
+        profiles[gene] = {"diplotype": diplotype, "phenotype": phenotype}
+    return profiles
+
+
+def read_manifest(manifest_path, default_output):
+    """Read a batch manifest: one ``input<TAB>output_dir`` row per patient.
+
+    The output column is optional and defaults to ``default_output/<input stem>``.
+    Blank lines and lines starting with '#' are ignored.
+    """
+    rows = []
+    for line in Path(manifest_path).read_text().split("\n"):
+        if not line.strip() or line.startswith("#"):
+            continue
+        parts = [p.strip() for p in line.split("\t")]
+        outdir = parts[1] if len(parts) > 1 and parts[1] else str(Path(default_output) / Path(parts[0]).stem)
+        rows.append((parts[0], outdir))
+    return rows
+
+
+def run_one(row, generated_at=None, write_json=False):
+    """Batch worker: write one patient's report. Returns (input, report path or None, error)."""
+    input_path, output_dir = row
+    generated_at = generated_at or report_timestamp()
+    try:
+        fmt, total_snps, pgx_snps, checksum = parse_and_hash(input_path)
+        if not pgx_snps:
+            return input_path, None, "no pharmacogenomic SNPs found"
+        profiles = build_profiles(pgx_snps)
+        drug_results = lookup_drugs(profiles)
+        report = generate_report(input_path, fmt, total_snps, pgx_snps, profiles, drug_results,
+                                 generated_at, checksum)
+        report_path = write_report(output_dir, report)
+        if write_json:
+            write_json_report(output_dir, build_json_payload(
+                input_path, fmt, total_snps, pgx_snps, profiles, drug_results, generated_at, checksum))
+    # ValueError covers UnicodeDecodeError and pandas' parser errors: one
+    # unreadable file is reported as failed instead of aborting the pool
+    except (OSError, ValueError) as exc:
+        return input_path, None, f"{type(exc).__name__}: {exc}"
+    return input_path, str(report_path), None
+
+
+def run_batch(manifest_path, default_output, processes=None, write_json=False):
+    """Generate one report per manifest row across a process pool."""
+    rows = read_manifest(manifest_path, default_output)
+    print(f"Batch: {len(rows)} patient(s) from {manifest_path}")
+    # One timestamp for the whole batch rather than a clock read per report
+    worker = partial(run_one, generated_at=report_timestamp(), write_json=write_json)
+    failed = 0
+    with Pool(processes) as pool:
+        for input_path, report_path, error in pool.imap(worker, rows):
+            if error:
+                failed += 1
+                print(f"  FAILED {input_path}: {error}", file=sys.stderr)
+            else:
+                print(f"  {input_path} -> {report_path}")
+    print(f"Done. {len(rows) - failed}/{len(rows)} reports written.")
+    return failed
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="ClawBio PharmGx Reporter: pharmacogenomic report from DTC genetic data")
-    parser.add_argument("--input", required=True, help="Path to genetic data file (23andMe/AncestryDNA)")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="Path to genetic data file (23andMe/AncestryDNA)")
+    source.add_argument("--batch", metavar="MANIFEST",
+                        help="TSV manifest of input files (and optional output dirs), one patient per line")
     parser.add_argument("--output", default="pharmgx_report", help="Output directory (default: pharmgx_report)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Worker processes for --batch (default: all CPUs)")
+    parser.add_argument("--json", action="store_true",
+                        help="Also write report.json with profiles and drug recommendations")
     args = parser.parse_args()
 
+    if args.batch:
+        if not Path(args.batch).exists():
+            print(f"Error: manifest not found: {args.batch}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(1 if run_batch(args.batch, args.output, args.jobs, args.json) else 0)
+
     if not Path(args.input).exists():
         print(f"Error: input file not found: {args.input}", file=sys.stderr)
         sys.exit(1)
@@ -1167,7 +1686,7 @@ def main():
 
     # Parse
     print(f"Parsing: {args.input}")
-    fmt, total_snps, pgx_snps = parse_file(args.input)
+    fmt, total_snps, pgx_snps, checksum = parse_and_hash(args.input)
     print(f"  Format: {fmt}")
     print(f"  Total SNPs: {total_snps}")
     print(f"  PGx SNPs found: {len(pgx_snps)}/{len(PGX_SNPS)}")
@@ -1184,11 +1703,7 @@ def main():
         sys.exit(1)
 
     # Profile genes
-    profiles = {}
-    for gene in GENE_DEFS:
-        diplotype = call_diplotype(gene, pgx_snps)
-        phenotype = call_phenotype(gene, diplotype)
-        profiles[gene] = {"diplotype": diplotype, "phenotype": phenotype}
+    profiles = build_profiles(pgx_snps)
 
     not_tested = [g for g, p in profiles.items() if p["diplotype"] == "NOT_TESTED"]
     if not_tested:
@@ -1225,13 +1740,16 @@ def main():
         print()
 
     # Generate report
-    outdir = Path(args.output)
-    outdir.mkdir(parents=True, exist_ok=True)
-    report = generate_report(args.input, fmt, total_snps, pgx_snps, profiles, drug_results)
-    report_path = outdir / "report.md"
-    report_path.write_text(report)
+    generated_at = report_timestamp()
+    report = generate_report(args.input, fmt, total_snps, pgx_snps, profiles, drug_results,
+                             generated_at, checksum)
+    report_path = write_report(args.output, report)
 
     print(f"Report saved: {report_path}")
+    if args.json:
+        json_path = write_json_report(args.output, build_json_payload(
+            args.input, fmt, total_snps, pgx_snps, profiles, drug_results, generated_at, checksum))
+        print(f"JSON saved: {json_path}")
     print("Done.")
 
 
@@ -0,0 +1,56 @@
+"""
+conftest.py — Shared fixtures for the PharmGx Reporter test suite
+
+The demo patient is parsed, profiled and run through the drug lookup
+once per session; individual tests only assert on the results.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pharmgx_reporter import build_profiles, drugs_by_name, generate_report, lookup_drugs, parse_file
+
+
+DEMO = Path(__file__).parent.parent / "demo_patient.txt"
+
+
+@pytest.fixture(scope="session")
+def demo_lines():
+    return DEMO.read_text().split("\n")
+
+
+@pytest.fixture(scope="session")
+def parsed():
+    """parse_file(DEMO) as (fmt, total_snps, pgx_snps)."""
+    return parse_file(str(DEMO))
+
+
+@pytest.fixture(scope="session")
+def pgx(parsed):
+    return parsed[2]
+
+
+@pytest.fixture(scope="session")
+def profiles(pgx):
+    return build_profiles(pgx)
+
+
+@pytest.fixture(scope="session")
+def results(profiles):
+    return lookup_drugs(profiles)
+
+
+@pytest.fixture(scope="session")
+def drug_index(results):
+    """{drug name: (classification, entry)} over the demo patient's drug results."""
+    return drugs_by_name(results)
+
+
+@pytest.fixture(scope="session")
+def report(pgx, profiles, results):
+    """Markdown report for the demo patient, rendered once."""
+    return generate_report(str(DEMO), "23andme", 31, pgx, profiles, results)
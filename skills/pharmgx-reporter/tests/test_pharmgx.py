@@ -4,25 +4,37 @@ test_pharmgx.py — Automated test suite for PharmGx Reporter
 Run with: pytest skills/pharmgx-reporter/tests/test_pharmgx.py -v
 
 Uses the FIXED demo patient (demo_patient.txt) with known genotypes
-so that all assertions are deterministic and reproducible.
+so that all assertions are deterministic and reproducible. The patient is
+parsed, profiled and run through the drug lookup once per session by the
+fixtures in conftest.py.
 """
 
+import hashlib
+import json
+import re
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import pharmgx_reporter
 from pharmgx_reporter import (
     PGX_SNPS,
     GENE_DEFS,
     GUIDELINES,
     detect_format,
-    parse_file,
-    call_diplotype,
-    call_phenotype,
+    parse_and_hash,
     phenotype_to_key,
-    lookup_drugs,
-    generate_report,
+    load_calls,
+    parse_file,
+    _scan_buffer,
+    _scan_lines,
+    _scan_mmap,
+    _validate_schema,
+    read_manifest,
+    run_one,
 )
 
 DEMO = Path(__file__).parent.parent / "demo_patient.txt"
@@ -30,13 +42,12 @@ DEMO = Path(__file__).parent.parent / "demo_patient.txt"
 
 # ── Parsing ────────────────────────────────────────────────────────────────────
 
-def test_detect_format_23andme():
-    lines = DEMO.read_text().split("\n")
-    assert detect_format(lines) == "23andme"
+def test_detect_format_23andme(demo_lines):
+    assert detect_format(demo_lines) == "23andme"
 
 
-def test_parse_file_finds_all_pgx_snps():
-    fmt, total_snps, pgx_snps = parse_file(str(DEMO))
+def test_parse_file_finds_all_pgx_snps(parsed):
+    fmt, total_snps, pgx_snps = parsed
     assert fmt == "23andme"
     assert total_snps == 30  # 31 data lines but one has genotype "--" or is skipped
     assert len(pgx_snps) == len(PGX_SNPS), (
@@ -44,8 +55,7 @@ def test_parse_file_finds_all_pgx_snps():
     )
 
 
-def test_parse_file_genotype_values():
-    _, _, pgx = parse_file(str(DEMO))
+def test_parse_file_genotype_values(pgx):
     # CYP2C19 *2 het
     assert pgx["rs4244285"]["genotype"] == "AG"
     # CYP2D6 *4 hom
@@ -54,92 +64,162 @@ def test_parse_file_genotype_values():
     assert pgx["rs9923231"]["genotype"] == "GA"
 
 
-# ── Star Allele Calling ───────────────────────────────────────────────────────
+# (name, file body) for load_calls shapes beyond the demo's 4-column rows
+LOAD_CALLS_CASES = [
+    ("five_column", "# rsid\tchromosome\tposition\tallele1\tallele2\n"
+                    "rs1799853\t10\t94942290\tC\tT\n"
+                    "rs4244285\t10\t94781859\tA\tG\n"),
+    ("hash_in_row", "# rsid\tchromosome\tposition\tgenotype\n"
+                    "rs1799853\t10\t94942290#b37\tCT\n"
+                    "rs4244285\t10\t94781859\tAG\n"),
+]
+
+
+def test_load_calls_matches_scan_lines():
+    pytest.importorskip("pandas")
+    assert load_calls(str(DEMO)) == _scan_lines(str(DEMO))
+
+
+@pytest.mark.parametrize("name,body", LOAD_CALLS_CASES)
+def test_load_calls_shapes_match_scan_lines(tmp_path, name, body):
+    pytest.importorskip("pandas")
+    path = tmp_path / f"{name}.txt"
+    path.write_text(body)
+    total, calls = load_calls(str(path))
+    assert (total, calls) == _scan_lines(str(path))
+    assert calls["rs1799853"] == "CT"
+
+
+def test_parse_file_falls_back_on_irregular_rows(tmp_path):
+    # A 5-field row after 4-field ones makes pandas raise, and a
+    # comma-separated row is not a tab layout; the scanners take over
+    path = tmp_path / "mixed.txt"
+    path.write_text("rs1799853\t10\t94942290\tCT\n"
+                    "rs4244285\t10\t94781859\tA\tG\n"
+                    "rs12248560,10,94761900,CT\n")
+    _, total, pgx = parse_file(str(path))
+    assert (total, {rs: info["genotype"] for rs, info in pgx.items()}) == _scan_lines(str(path))
+    assert pgx["rs4244285"]["genotype"] == "AG"
+
 
-def _profiles():
-    """Build profiles from demo patient for reuse across tests."""
-    _, _, pgx = parse_file(str(DEMO))
-    profiles = {}
-    for gene in GENE_DEFS:
-        diplotype = call_diplotype(gene, pgx)
-        phenotype = call_phenotype(gene, diplotype)
-        profiles[gene] = {"diplotype": diplotype, "phenotype": phenotype}
-    return profiles
+def test_cr_only_line_endings_parse_like_lf(tmp_path):
+    # Old Mac exports end lines with a bare CR, which the regex scan cannot
+    # anchor on; parse_and_hash must fall back and agree with the LF file
+    lf = DEMO.read_bytes().replace(b"\r\n", b"\n")
+    path = tmp_path / "cr_only.txt"
+    path.write_bytes(lf.replace(b"\n", b"\r"))
+    assert _scan_buffer(path.read_bytes()) is None
+    fmt, total, pgx, _ = parse_and_hash(str(path))
+    assert (total, pgx) == parse_file(str(DEMO))[1:]
+    assert (total, {rs: info["genotype"] for rs, info in pgx.items()}) == _scan_lines(str(path))
+
+
+# (name, file body, total SNPs): uncommented header rows count exactly as
+# _scan_lines counts them, i.e. only a line naming "chromosome" is skipped
+HEADER_CASES = [
+    ("full_header", "RSID\tChromosome\tposition\tgenotype\n"
+                    "rs1799853\t10\t94942290\tCT\n", 1),
+    ("short_header", "rsid\tchrom\tpos\tgenotype\n"
+                     "rs1799853\t10\t94942290\tCT\n", 2),
+]
+
+
+@pytest.mark.parametrize("has_pandas", [True, False])
+@pytest.mark.parametrize("name,body,total", HEADER_CASES)
+def test_header_rows_count_like_scan_lines(tmp_path, monkeypatch, name, body, total, has_pandas):
+    if has_pandas:
+        pytest.importorskip("pandas")
+    monkeypatch.setattr(pharmgx_reporter, "HAS_PANDAS", has_pandas)
+    path = tmp_path / f"{name}.txt"
+    path.write_text(body)
+    expected = _scan_lines(str(path))
+    assert expected[0] == total
+    for parsed_total, pgx in (parse_file(str(path))[1:], parse_and_hash(str(path))[1:3]):
+        assert (parsed_total, {rs: info["genotype"] for rs, info in pgx.items()}) == expected
+
+
+def test_cr_only_line_endings_without_pandas(tmp_path, monkeypatch):
+    monkeypatch.setattr(pharmgx_reporter, "HAS_PANDAS", False)
+    path = tmp_path / "cr_only.txt"
+    path.write_bytes(DEMO.read_bytes().replace(b"\r\n", b"\n").replace(b"\n", b"\r"))
+    assert _scan_mmap(str(path)) is None
+    assert parse_file(str(path))[1:] == parse_file(str(DEMO))[1:]
+
+
+def test_scan_mmap_matches_parse_file(parsed):
+    _, total_snps, pgx = parsed
+    assert _scan_mmap(str(DEMO)) == (
+        total_snps, {rsid: info["genotype"] for rsid, info in pgx.items()}
+    )
+
+
+def test_parse_and_hash_single_read_matches(parsed):
+    fmt, total, pgx, checksum = parse_and_hash(str(DEMO))
+    assert (fmt, total, pgx) == parsed
+    assert checksum == hashlib.sha256(DEMO.read_bytes()).hexdigest()
 
 
-def test_cyp2c19_diplotype():
+# ── Star Allele Calling ───────────────────────────────────────────────────────
+
+def test_cyp2c19_diplotype(profiles):
     """Demo patient: rs4244285 AG (*2 het), rest ref → *1/*2."""
-    p = _profiles()
-    assert p["CYP2C19"]["diplotype"] == "*1/*2"
+    assert profiles["CYP2C19"]["diplotype"] == "*1/*2"
 
 
-def test_cyp2d6_diplotype():
+def test_cyp2d6_diplotype(profiles):
     """Demo patient: rs3892097 TT (*4 hom) → *4/*4."""
-    p = _profiles()
-    assert p["CYP2D6"]["diplotype"] == "*4/*4"
+    assert profiles["CYP2D6"]["diplotype"] == "*4/*4"
 
 
-def test_vkorc1_genotype():
+def test_vkorc1_genotype(profiles):
     """Demo patient: rs9923231 GA → GA diplotype."""
-    p = _profiles()
-    assert p["VKORC1"]["diplotype"] == "GA"
+    assert profiles["VKORC1"]["diplotype"] == "GA"
 
 
-def test_slco1b1_genotype():
+def test_slco1b1_genotype(profiles):
     """Demo patient: rs4149056 TC → TC diplotype."""
-    p = _profiles()
-    assert p["SLCO1B1"]["diplotype"] == "TC"
+    assert profiles["SLCO1B1"]["diplotype"] == "TC"
 
 
-def test_cyp3a5_diplotype():
+def test_cyp3a5_diplotype(profiles):
     """Demo patient: rs776746 GG (*3 hom) → *3/*3."""
-    p = _profiles()
-    assert p["CYP3A5"]["diplotype"] == "*3/*3"
+    assert profiles["CYP3A5"]["diplotype"] == "*3/*3"
 
 
 # ── Phenotype Assignment ──────────────────────────────────────────────────────
 
-def test_cyp2c19_intermediate():
-    p = _profiles()
-    assert p["CYP2C19"]["phenotype"] == "Intermediate Metabolizer"
+def test_cyp2c19_intermediate(profiles):
+    assert profiles["CYP2C19"]["phenotype"] == "Intermediate Metabolizer"
 
 
-def test_cyp2d6_poor():
-    p = _profiles()
-    assert p["CYP2D6"]["phenotype"] == "Poor Metabolizer"
+def test_cyp2d6_poor(profiles):
+    assert profiles["CYP2D6"]["phenotype"] == "Poor Metabolizer"
 
 
-def test_vkorc1_intermediate_sensitivity():
-    p = _profiles()
-    assert p["VKORC1"]["phenotype"] == "Intermediate Warfarin Sensitivity"
+def test_vkorc1_intermediate_sensitivity(profiles):
+    assert profiles["VKORC1"]["phenotype"] == "Intermediate Warfarin Sensitivity"
 
 
-def test_slco1b1_intermediate():
-    p = _profiles()
-    assert p["SLCO1B1"]["phenotype"] == "Intermediate Function"
+def test_slco1b1_intermediate(profiles):
+    assert profiles["SLCO1B1"]["phenotype"] == "Intermediate Function"
 
 
-def test_cyp3a5_nonexpressor():
-    p = _profiles()
-    assert p["CYP3A5"]["phenotype"] == "CYP3A5 Non-expressor"
+def test_cyp3a5_nonexpressor(profiles):
+    assert profiles["CYP3A5"]["phenotype"] == "CYP3A5 Non-expressor"
 
 
-def test_dpyd_normal():
+def test_dpyd_normal(profiles):
     """All DPYD SNPs are ref → Normal Metabolizer."""
-    p = _profiles()
-    assert p["DPYD"]["phenotype"] == "Normal Metabolizer"
+    assert profiles["DPYD"]["phenotype"] == "Normal Metabolizer"
 
 
-def test_tpmt_normal():
-    p = _profiles()
-    assert p["TPMT"]["phenotype"] == "Normal Metabolizer"
+def test_tpmt_normal(profiles):
+    assert profiles["TPMT"]["phenotype"] == "Normal Metabolizer"
 
 
 # ── Drug Recommendations ──────────────────────────────────────────────────────
 
-def test_drug_lookup_returns_all_categories():
-    p = _profiles()
-    results = lookup_drugs(p)
+def test_drug_lookup_returns_all_categories(results):
     assert "standard" in results
     assert "caution" in results
     assert "avoid" in results
@@ -147,77 +227,97 @@ def test_drug_lookup_returns_all_categories():
     assert total > 0
 
 
-def test_clopidogrel_caution_for_intermediate():
+def test_clopidogrel_caution_for_intermediate(drug_index):
     """CYP2C19 *1/*2 → Intermediate → Clopidogrel should be caution."""
-    p = _profiles()
-    results = lookup_drugs(p)
-    clop = [d for d in results["caution"] if d["drug"] == "Clopidogrel"]
-    assert len(clop) == 1, "Clopidogrel should be in caution list"
+    assert drug_index["Clopidogrel"][0] == "caution", "Clopidogrel should be in caution list"
 
 
-def test_codeine_avoid_for_poor_cyp2d6():
+def test_codeine_avoid_for_poor_cyp2d6(drug_index):
     """CYP2D6 *4/*4 → Poor Metabolizer → Codeine should be avoid."""
-    p = _profiles()
-    results = lookup_drugs(p)
-    codeine = [d for d in results["avoid"] if d["drug"] == "Codeine"]
-    assert len(codeine) == 1, "Codeine should be in avoid list for CYP2D6 PM"
+    assert drug_index["Codeine"][0] == "avoid", "Codeine should be in avoid list for CYP2D6 PM"
 
 
-def test_simvastatin_caution_for_intermediate_slco1b1():
+def test_simvastatin_caution_for_intermediate_slco1b1(drug_index):
     """SLCO1B1 TC → Intermediate → Simvastatin should be caution."""
-    p = _profiles()
-    results = lookup_drugs(p)
-    simva = [d for d in results["caution"] if d["drug"] == "Simvastatin"]
-    assert len(simva) == 1, "Simvastatin should be in caution list"
+    assert drug_index["Simvastatin"][0] == "caution", "Simvastatin should be in caution list"
 
 
 # ── Phenotype Key Mapping ─────────────────────────────────────────────────────
 
-def test_phenotype_key_mapping():
-    assert phenotype_to_key("Normal Metabolizer") == "normal_metabolizer"
-    assert phenotype_to_key("Poor Metabolizer") == "poor_metabolizer"
-    assert phenotype_to_key("High Warfarin Sensitivity") == "high_warfarin_sensitivity"
-    assert phenotype_to_key("CYP3A5 Non-expressor") == "poor_metabolizer"
-    assert phenotype_to_key("Normal (inferred)") == "normal_metabolizer"
+@pytest.mark.parametrize("pheno,key", [
+    ("Normal Metabolizer", "normal_metabolizer"),
+    ("Poor Metabolizer", "poor_metabolizer"),
+    ("High Warfarin Sensitivity", "high_warfarin_sensitivity"),
+    ("CYP3A5 Non-expressor", "poor_metabolizer"),
+    ("Normal (inferred)", "normal_metabolizer"),
+])
+def test_phenotype_key_mapping(pheno, key):
+    assert phenotype_to_key(pheno) == key
 
 
 # ── Report Generation ─────────────────────────────────────────────────────────
 
-def test_report_contains_key_sections():
-    _, _, pgx = parse_file(str(DEMO))
-    p = _profiles()
-    results = lookup_drugs(p)
-    report = generate_report(str(DEMO), "23andme", 31, pgx, p, results)
-    assert "# ClawBio PharmGx Report" in report
-    assert "Drug Response Summary" in report
-    assert "Gene Profiles" in report
-    assert "Detected Variants" in report
-    assert "Disclaimer" in report
-    assert "Methods" in report
-    assert "Reproducibility" in report
-
-
-def test_report_contains_disclaimer():
-    _, _, pgx = parse_file(str(DEMO))
-    p = _profiles()
-    results = lookup_drugs(p)
-    report = generate_report(str(DEMO), "23andme", 31, pgx, p, results)
+REPORT_SECTIONS = (
+    "# ClawBio PharmGx Report",
+    "Drug Response Summary",
+    "Gene Profiles",
+    "Detected Variants",
+    "Disclaimer",
+    "Methods",
+    "Reproducibility",
+)
+# One pass over the report finds every section heading
+_SECTIONS_RE = re.compile("|".join(map(re.escape, REPORT_SECTIONS)))
+
+
+def test_report_contains_key_sections(report):
+    missing = set(REPORT_SECTIONS) - set(_SECTIONS_RE.findall(report))
+    assert not missing, f"Report is missing sections: {sorted(missing)}"
+
+
+def test_report_contains_disclaimer(report):
     assert "NOT a diagnostic device" in report
 
 
-# ── Data Integrity ─────────────────────────────────────────────────────────────
+def test_batch_manifest_and_worker(tmp_path):
+    manifest = tmp_path / "manifest.tsv"
+    manifest.write_text(f"# patients\n{DEMO}\n{DEMO}\t{tmp_path / 'custom'}\n")
+    rows = read_manifest(manifest, tmp_path / "out")
+    assert rows == [
+        (str(DEMO), str(tmp_path / "out" / "demo_patient")),
+        (str(DEMO), str(tmp_path / "custom")),
+    ]
+    input_path, report_path, error = run_one(rows[1])
+    assert error is None
+    assert "# ClawBio PharmGx Report" in Path(report_path).read_text()
+    assert run_one((str(tmp_path / "missing.txt"), str(tmp_path)))[2]
+
 
-def test_all_genes_have_phenotype_mappings():
-    """Every gene in GENE_DEFS must have at least one phenotype."""
-    for gene, gdef in GENE_DEFS.items():
-        assert "phenotypes" in gdef, f"{gene} missing phenotypes"
-        assert len(gdef["phenotypes"]) >= 2, f"{gene} has fewer than 2 phenotypes"
+def test_batch_worker_reports_parse_errors(tmp_path, monkeypatch):
+    def bad_parse(path):
+        raise ValueError("Error tokenizing data")
 
+    monkeypatch.setattr(pharmgx_reporter, "parse_and_hash", bad_parse)
+    input_path, report_path, error = run_one((str(DEMO), str(tmp_path)))
+    assert report_path is None
+    assert error == "ValueError: Error tokenizing data"
+
+
+def test_json_report_round_trips(tmp_path):
+    _, report_path, error = run_one((str(DEMO), str(tmp_path)), write_json=True)
+    assert error is None
+    payload = json.loads((tmp_path / "report.json").read_text())
+    assert payload["meta"]["pgx_snps_found"] == len(PGX_SNPS)
+    assert payload["meta"]["checksum_sha256"] == hashlib.sha256(DEMO.read_bytes()).hexdigest()
+    assert set(payload["profiles"]) == set(GENE_DEFS)
+    assert sum(len(v) for v in payload["drugs"].values()) == len(GUIDELINES)
+
+
+# ── Data Integrity ─────────────────────────────────────────────────────────────
 
-def test_all_guideline_drugs_reference_valid_genes():
-    """Every drug in GUIDELINES must reference a gene in GENE_DEFS."""
-    for drug, info in GUIDELINES.items():
-        if info.get("special") == "warfarin":
-            continue
-        gene = info["gene"]
-        assert gene in GENE_DEFS, f"{drug} references unknown gene {gene}"
+def test_schema_is_valid():
+    """GENE_DEFS/GUIDELINES are checked at import; a bad reference must raise."""
+    _validate_schema()
+    bad = {"Testdrug": {"gene": "NOPE1"}}
+    with pytest.raises(ValueError, match="unknown gene NOPE1"):
+        _validate_schema(guidelines=bad)